@@ -103,9 +103,11 @@ def restore_backup(request: Request, filename: str) -> BackupRestoreResponse:
         service.restore_backup(filename)
 
         # Reset database connections to use restored data
-        from html_tool_manager.core.db import engine
+        from html_tool_manager.core.db import create_db_and_tables, engine
 
         engine.dispose()
+        # The backup may predate newer tables (e.g. tool_tags_fts), so bring its schema up to date
+        create_db_and_tables()
 
         return BackupRestoreResponse(
             success=True,
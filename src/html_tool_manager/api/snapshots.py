@@ -1,5 +1,6 @@
 """Snapshot API endpoints."""
 
+import difflib
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -28,9 +29,9 @@ class DiffResponse(BaseModel):
     """Response model for diff endpoint."""
 
     old_snapshot_id: int
-    old_content: str
     new_snapshot_id: Optional[int]  # None = current content
-    new_content: str
+    diff: str  # unified diff（内容が同じ場合は空文字列）
+    equal: bool
 
 
 def _get_tool_or_404(tool_id: int, session: Session) -> None:
@@ -60,6 +61,29 @@ def _read_current_content(filepath: str) -> str:
         )
 
 
+def _unified_diff(old_content: str, new_content: str, old_label: str, new_label: str) -> str:
+    """Build a unified diff between two contents.
+
+    Args:
+        old_content: The content before the change.
+        new_content: The content after the change.
+        old_label: The name shown for the old content.
+        new_label: The name shown for the new content.
+
+    Returns:
+        The unified diff text.
+
+    """
+    # 改行コードを保持したまま比較し、末尾改行や CRLF/LF の違いも差分として出す
+    lines = difflib.unified_diff(
+        old_content.splitlines(keepends=True),
+        new_content.splitlines(keepends=True),
+        fromfile=old_label,
+        tofile=new_label,
+    )
+    return "".join(line if line.endswith("\n") else f"{line}\n\\ No newline at end of file\n" for line in lines)
+
+
 @router.get("/", response_model=List[SnapshotRead])
 def list_snapshots(
     tool_id: int,
@@ -240,14 +264,20 @@ def get_diff(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Compare snapshot not found")
         new_content = compare_snapshot.html_content
         new_snapshot_id = compare_to
+        new_label = f"snapshot #{compare_to}"
     else:
         # Compare with current content
         new_content = _read_current_content(tool.filepath)
         new_snapshot_id = None
+        new_label = "current"
+
+    # 両方の全文を返さず、変更箇所だけの unified diff を返す
+    equal = old_content == new_content
+    diff = "" if equal else _unified_diff(old_content, new_content, f"snapshot #{snapshot_id}", new_label)
 
     return DiffResponse(
         old_snapshot_id=snapshot_id,
-        old_content=old_content,
         new_snapshot_id=new_snapshot_id,
-        new_content=new_content,
+        diff=diff,
+        equal=equal,
     )
@@ -1,6 +1,7 @@
 """Database backup service."""
 
 import logging
+import os
 import re
 import sqlite3
 from dataclasses import dataclass
@@ -11,6 +12,52 @@ logger = logging.getLogger(__name__)
 
 # Backup filename pattern: tools_YYYYMMDD_HHMMSS.db
 BACKUP_FILENAME_PATTERN = re.compile(r"^tools_\d{8}_\d{6}\.db$")
+BACKUP_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# Units for BackupInfo.size_human, one per power of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def _prefetch_file(path: Path) -> None:
+    """Ask the kernel to start reading a file into the page cache.
+
+    POSIX_FADV_WILLNEED populates the shared page cache, so the read-ahead
+    also benefits SQLite's own connection to the file. Failures are ignored
+    because this is only a hint.
+
+    Args:
+        path: File to prefetch.
+
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _parse_backup_timestamp(filename: str) -> datetime | None:
+    """Return the UTC creation time encoded in a backup filename.
+
+    Args:
+        filename: Backup filename matching BACKUP_FILENAME_PATTERN.
+
+    Returns:
+        The timestamp, or None if the digits do not form a valid date.
+
+    """
+    try:
+        parsed = datetime.strptime(filename[len("tools_") : -len(".db")], BACKUP_TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=timezone.utc)
 
 
 @dataclass
@@ -25,12 +72,9 @@ class BackupInfo:
     @property
     def size_human(self) -> str:
         """Return human-readable file size."""
-        size: float = float(self.size_bytes)
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        # Each unit step is 10 bits (1024), so the bit length selects the unit directly
+        idx = min(max(0, (self.size_bytes.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+        return f"{self.size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 
 class BackupError(Exception):
@@ -85,10 +129,13 @@ class BackupService:
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate filename with timestamp
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        filename = f"tools_{timestamp}.db"
+        created_at = datetime.now(timezone.utc).replace(microsecond=0)
+        filename = f"tools_{created_at.strftime(BACKUP_TIMESTAMP_FORMAT)}.db"
         backup_path = self.backup_dir / filename
 
+        # Start reading the database ahead of the page-by-page backup copy
+        _prefetch_file(self.db_path)
+
         try:
             # Use SQLite backup API for WAL mode safety
             # This ensures consistent backups even with active connections
@@ -106,12 +153,11 @@ class BackupService:
             logger.info("Created backup: %s", filename)
 
             # Get backup info before rotation
-            stat = backup_path.stat()
             backup_info = BackupInfo(
                 filename=filename,
                 filepath=backup_path,
-                created_at=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
-                size_bytes=stat.st_size,
+                created_at=created_at,
+                size_bytes=backup_path.stat().st_size,
             )
 
             # Rotate old backups (after we have the new backup's info)
@@ -128,29 +174,43 @@ class BackupService:
         Returns:
             List of BackupInfo objects.
 
+        """
+        backups = []
+        for path in self._backup_paths():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            created_at = _parse_backup_timestamp(path.name)
+            if created_at is None:
+                created_at = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+            backups.append(
+                BackupInfo(
+                    filename=path.name,
+                    filepath=path,
+                    created_at=created_at,
+                    size_bytes=stat.st_size,
+                )
+            )
+        return backups
+
+    def _backup_paths(self) -> list[Path]:
+        """Return backup file paths, newest first.
+
+        Filenames embed a zero-padded UTC timestamp, so sorting them by name
+        orders backups by creation time without a stat call per file.
+
+        Returns:
+            List of backup file paths.
+
         """
         if not self.backup_dir.exists():
             return []
 
-        backups = []
-        for path in self.backup_dir.glob("tools_*.db"):
-            if BACKUP_FILENAME_PATTERN.match(path.name):
-                try:
-                    stat = path.stat()
-                    backups.append(
-                        BackupInfo(
-                            filename=path.name,
-                            filepath=path,
-                            created_at=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
-                            size_bytes=stat.st_size,
-                        )
-                    )
-                except OSError:
-                    continue
-
-        # Sort by creation time, newest first
-        backups.sort(key=lambda b: b.created_at, reverse=True)
-        return backups
+        with os.scandir(self.backup_dir) as entries:
+            names = [entry.name for entry in entries if BACKUP_FILENAME_PATTERN.match(entry.name)]
+        names.sort(reverse=True)
+        return [self.backup_dir / name for name in names]
 
     def restore_backup(self, filename: str) -> bool:
         """Restore the database from a backup.
@@ -243,14 +303,12 @@ class BackupService:
 
     def _rotate_backups(self) -> None:
         """Remove old backups exceeding max_generations."""
-        backups = self.list_backups()
-        if len(backups) > self.max_generations:
-            for backup in backups[self.max_generations :]:
-                try:
-                    backup.filepath.unlink()
-                    logger.info("Rotated old backup: %s", backup.filename)
-                except OSError as e:
-                    logger.warning("Failed to rotate backup %s: %s", backup.filename, e)
+        for path in self._backup_paths()[self.max_generations :]:
+            try:
+                path.unlink()
+                logger.info("Rotated old backup: %s", path.name)
+            except OSError as e:
+                logger.warning("Failed to rotate backup %s: %s", path.name, e)
 
     def _validate_filename(self, filename: str) -> None:
         """Validate backup filename for security.
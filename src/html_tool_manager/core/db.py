@@ -1,5 +1,6 @@
 from typing import Generator
 
+from sqlalchemy.engine import Engine
 from sqlmodel import Session, SQLModel, create_engine, text
 
 from html_tool_manager.core.config import app_settings
@@ -10,12 +11,21 @@ DATABASE_URL = f"sqlite:///{app_settings.database_path}"
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 
 
-def create_db_and_tables() -> None:
-    """データベースとテーブルを作成し、FTS5仮想テーブルをセットアップします。"""
-    SQLModel.metadata.create_all(engine)
+def create_db_and_tables(bind: Engine | None = None) -> None:
+    """データベースとテーブルを作成し、FTS5仮想テーブルをセットアップします。
+
+    何度呼び出しても安全で、バックアップから復元した古いスキーマのデータベースにも
+    不足しているテーブル・トリガーを追加します。
+
+    Args:
+        bind: 対象のエンジン。省略時はモジュールの engine を使用します。
+
+    """
+    bind = bind if bind is not None else engine
+    SQLModel.metadata.create_all(bind)
 
     # FTS5仮想テーブルの作成（存在しない場合のみ）
-    with engine.connect() as conn:
+    with bind.connect() as conn:
         conn.execute(
             text("""
             CREATE VIRTUAL TABLE IF NOT EXISTS tool_fts
@@ -50,6 +60,42 @@ def create_db_and_tables() -> None:
             END
         """)
         )
+
+        # タグの部分一致検索用の trigram FTS5 テーブル（tags は JSON 文字列のまま索引する）
+        tags_fts_exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tool_tags_fts'")
+        ).first()
+        conn.execute(
+            text("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS tool_tags_fts
+            USING fts5(tags, content='tool', content_rowid='id', tokenize='trigram')
+        """)
+        )
+        if tags_fts_exists is None:
+            # 既存のデータベースに後から追加した場合は、既存の行を索引に取り込む
+            conn.execute(text("INSERT INTO tool_tags_fts(tool_tags_fts) VALUES ('rebuild')"))
+        conn.execute(
+            text("""
+            CREATE TRIGGER IF NOT EXISTS tool_tags_ai AFTER INSERT ON tool BEGIN
+                INSERT INTO tool_tags_fts(rowid, tags) VALUES (new.id, new.tags);
+            END
+        """)
+        )
+        conn.execute(
+            text("""
+            CREATE TRIGGER IF NOT EXISTS tool_tags_ad AFTER DELETE ON tool BEGIN
+                INSERT INTO tool_tags_fts(tool_tags_fts, rowid, tags) VALUES ('delete', old.id, old.tags);
+            END
+        """)
+        )
+        conn.execute(
+            text("""
+            CREATE TRIGGER IF NOT EXISTS tool_tags_au AFTER UPDATE OF tags ON tool BEGIN
+                INSERT INTO tool_tags_fts(tool_tags_fts, rowid, tags) VALUES ('delete', old.id, old.tags);
+                INSERT INTO tool_tags_fts(rowid, tags) VALUES (new.id, new.tags);
+            END
+        """)
+        )
         conn.commit()
 
 
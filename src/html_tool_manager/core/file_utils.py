@@ -1,14 +1,121 @@
 """File utilities for safe file operations."""
 
+import errno
 import os
+import stat
 import tempfile
+import uuid
+
+# errno values returned when the platform/filesystem does not support O_TMPFILE
+_O_TMPFILE_UNSUPPORTED = frozenset({errno.EINVAL, errno.EISDIR, errno.EOPNOTSUPP})
+# errno values returned when an O_TMPFILE file cannot be linked via /proc/self/fd
+_LINK_UNSUPPORTED = frozenset({errno.ENOENT, errno.EXDEV})
+
+# Cleared once O_TMPFILE files turn out not to be linkable on this system
+_unnamed_temp_supported = True
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all bytes to a file descriptor, retrying on short writes.
+
+    Args:
+        fd: File descriptor to write to.
+        data: The bytes to write.
+
+    """
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _ensure_mode(fd: int, mode: int) -> None:
+    """Set the permission bits of an open file unless they already match.
+
+    Args:
+        fd: File descriptor of the file.
+        mode: The desired permission mode.
+
+    """
+    if stat.S_IMODE(os.fstat(fd).st_mode) != mode:
+        os.fchmod(fd, mode)
+
+
+def _open_unnamed_temp(dir_path: str, mode: int) -> int | None:
+    """Open an unnamed temporary file in a directory using O_TMPFILE.
+
+    Args:
+        dir_path: Directory in which the file will later be linked.
+        mode: File permission mode passed to open().
+
+    Returns:
+        A writable file descriptor, or None if O_TMPFILE is not supported.
+
+    """
+    o_tmpfile = getattr(os, "O_TMPFILE", None)
+    if o_tmpfile is None or not _unnamed_temp_supported:
+        return None
+    try:
+        return os.open(dir_path, o_tmpfile | os.O_WRONLY, mode)
+    except OSError as e:
+        if e.errno in _O_TMPFILE_UNSUPPORTED:
+            return None
+        raise
+
+
+def _link_into_place(fd: int, filepath: str, dir_path: str) -> bool:
+    """Give an unnamed temporary file its final name.
+
+    A new file is linked directly to the target path. An existing file cannot
+    be overwritten by linkat(), so the file is linked under a temporary name
+    first and then moved over the target with os.replace().
+
+    Args:
+        fd: File descriptor opened with O_TMPFILE.
+        filepath: The target file path.
+        dir_path: Directory containing the target file.
+
+    Returns:
+        False if the file cannot be linked on this system (e.g. /proc is not
+        available), True once the file is in place.
+
+    """
+    global _unnamed_temp_supported
+
+    proc_path = f"/proc/self/fd/{fd}"
+    temp_path = os.path.join(dir_path, f".{os.path.basename(filepath)}.{uuid.uuid4().hex}.tmp")
+    try:
+        try:
+            os.link(proc_path, filepath, follow_symlinks=True)
+            return True
+        except FileExistsError:
+            # An existing target is checked before the link itself, so the
+            # link under a temporary name can still turn out to be unsupported
+            os.link(proc_path, temp_path, follow_symlinks=True)
+    except OSError as e:
+        if e.errno in _LINK_UNSUPPORTED:
+            _unnamed_temp_supported = False
+            return False
+        raise
+
+    try:
+        os.replace(temp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return True
 
 
 def atomic_write_file(filepath: str, content: str, mode: int = 0o644) -> None:
     """Write content to a file atomically.
 
-    Uses a temporary file and os.replace() to ensure atomic writes.
-    This prevents file corruption if the process crashes during write.
+    On Linux the content is written to an unnamed O_TMPFILE file which only
+    gets a directory entry once fully written, so an aborted write leaves
+    nothing behind. Elsewhere a named temporary file and os.replace() are used.
+    Either way this prevents file corruption if the process crashes during write.
 
     Args:
         filepath: The target file path to write to. Parent directory must exist.
@@ -22,14 +129,30 @@ def atomic_write_file(filepath: str, content: str, mode: int = 0o644) -> None:
 
     """
     dir_path = os.path.dirname(filepath) or "."
+    # ASCII-only content (the common case) takes the ASCII codec's fast path
+    data = content.encode("ascii") if content.isascii() else content.encode("utf-8")
+
+    fd = _open_unnamed_temp(dir_path, mode)
+    if fd is not None:
+        try:
+            _write_all(fd, data)
+            # The mode given to open() is subject to umask
+            _ensure_mode(fd, mode)
+            if _link_into_place(fd, filepath, dir_path):
+                return
+        finally:
+            os.close(fd)
 
     # Create temp file in the same directory for atomic replace
-    temp_fd, temp_path = tempfile.mkstemp(dir=dir_path, text=True)
+    temp_fd, temp_path = tempfile.mkstemp(dir=dir_path)
     try:
-        with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
-            f.write(content)
-        # Set permissions before replace
-        os.chmod(temp_path, mode)
+        try:
+            _write_all(temp_fd, data)
+            # Set permissions before replace (by path: os.fchmod is unavailable on Windows before Python 3.13)
+            if stat.S_IMODE(os.fstat(temp_fd).st_mode) != mode:
+                os.chmod(temp_path, mode)
+        finally:
+            os.close(temp_fd)
         # Atomic replace (works on POSIX and Windows)
         os.replace(temp_path, filepath)
     except BaseException:
@@ -5,7 +5,6 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
-from apscheduler.schedulers.background import BackgroundScheduler  # type: ignore[import-untyped]
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
@@ -85,6 +84,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             logger.error("Failed to create startup backup: %s", e)
 
     # スケジューラ起動（app.stateに格納）
+    # APScheduler の import は重いため、lifespan を使わない TestClient などでは読み込まない
+    from apscheduler.schedulers.background import BackgroundScheduler  # type: ignore[import-untyped]
+
     app.state.scheduler = BackgroundScheduler()
     app.state.scheduler.add_job(
         backup_service.create_backup,
@@ -51,35 +51,8 @@ class SnapshotRepository:
             ValueError: If html_content exceeds MAX_CONTENT_SIZE_BYTES.
 
         """
-        # コンテンツサイズの検証
-        content_size = len(html_content.encode("utf-8"))
-        if content_size > MAX_CONTENT_SIZE_BYTES:
-            raise ValueError(
-                f"Content size ({content_size} bytes) exceeds maximum allowed ({MAX_CONTENT_SIZE_BYTES} bytes)"
-            )
-
-        # ロック付きでカウントを取得（SQLiteではBEGIN IMMEDIATEに変換される）
-        count_statement = (
-            select(func.count()).select_from(ToolSnapshot).where(ToolSnapshot.tool_id == tool_id).with_for_update()
-        )
-        count: int = self.session.exec(count_statement).one()
-
-        # 上限チェックと古いスナップショットの削除（1つ分の空きを確保）
-        threshold = MAX_SNAPSHOTS_PER_TOOL - 1
-        if count > threshold:
-            to_delete = count - threshold
-            subquery = (
-                select(ToolSnapshot.id)
-                .where(ToolSnapshot.tool_id == tool_id)
-                .order_by(ToolSnapshot.created_at.asc())  # type: ignore[attr-defined]
-                .limit(to_delete)
-            )
-            old_ids = list(self.session.exec(subquery).all())
-            if old_ids:
-                delete_statement = delete(ToolSnapshot).where(
-                    ToolSnapshot.id.in_(old_ids)  # type: ignore[union-attr]
-                )
-                self.session.exec(delete_statement)
+        self._validate_content_size(html_content)
+        self.enforce_retention(tool_id, reserve=1)
 
         # 新しいスナップショットを作成
         snapshot = ToolSnapshot(
@@ -97,6 +70,109 @@ class SnapshotRepository:
 
         return snapshot
 
+    def create_snapshots_bulk(
+        self,
+        tool_id: int,
+        html_contents: List[str],
+        snapshot_type: SnapshotType = SnapshotType.AUTO,
+    ) -> List[ToolSnapshot]:
+        """Create several snapshots at once, enforcing the retention limit once.
+
+        The contents are treated as oldest first. Contents that would be pruned
+        immediately because they exceed the retention limit are not inserted.
+
+        Args:
+            tool_id: The ID of the tool.
+            html_contents: The HTML contents to snapshot, oldest first.
+            snapshot_type: The type of the snapshots.
+
+        Returns:
+            The created snapshots, oldest first.
+
+        Raises:
+            ValueError: If any content exceeds MAX_CONTENT_SIZE_BYTES.
+
+        """
+        for html_content in html_contents:
+            self._validate_content_size(html_content)
+
+        # 上限を超える分は挿入してもすぐ削除されるため、新しいものだけを残す
+        kept_contents = html_contents[-MAX_SNAPSHOTS_PER_TOOL:]
+        if not kept_contents:
+            return []
+        self.enforce_retention(tool_id, reserve=len(kept_contents))
+
+        # 同じ作成日時になるため、並び順は id で決まる
+        created_at = datetime.now(timezone.utc)
+        snapshots = [
+            ToolSnapshot(
+                tool_id=tool_id,
+                html_content=html_content,
+                snapshot_type=snapshot_type,
+                created_at=created_at,
+            )
+            for html_content in kept_contents
+        ]
+        self.session.add_all(snapshots)
+        self.session.commit()
+
+        return snapshots
+
+    @staticmethod
+    def _validate_content_size(html_content: str) -> None:
+        """Check that content fits within MAX_CONTENT_SIZE_BYTES.
+
+        Args:
+            html_content: The HTML content to check.
+
+        Raises:
+            ValueError: If html_content exceeds MAX_CONTENT_SIZE_BYTES.
+
+        """
+        content_size = len(html_content.encode("utf-8"))
+        if content_size > MAX_CONTENT_SIZE_BYTES:
+            raise ValueError(
+                f"Content size ({content_size} bytes) exceeds maximum allowed ({MAX_CONTENT_SIZE_BYTES} bytes)"
+            )
+
+    def enforce_retention(self, tool_id: int, reserve: int = 0) -> int:
+        """Delete the oldest snapshots of a tool beyond the retention limit.
+
+        The caller is responsible for committing the deletion.
+
+        Args:
+            tool_id: The ID of the tool.
+            reserve: The number of snapshots about to be created, for which
+                room is made within MAX_SNAPSHOTS_PER_TOOL.
+
+        Returns:
+            The number of deleted snapshots.
+
+        """
+        # ロック付きでカウントを取得（SQLiteではBEGIN IMMEDIATEに変換される）
+        count_statement = (
+            select(func.count()).select_from(ToolSnapshot).where(ToolSnapshot.tool_id == tool_id).with_for_update()
+        )
+        count: int = self.session.exec(count_statement).one()
+
+        # 上限チェックと古いスナップショットの削除（reserve 個分の空きを確保）
+        threshold = MAX_SNAPSHOTS_PER_TOOL - reserve
+        if count <= threshold:
+            return 0
+        subquery = (
+            select(ToolSnapshot.id)
+            .where(ToolSnapshot.tool_id == tool_id)
+            .order_by(ToolSnapshot.created_at.asc(), ToolSnapshot.id.asc())  # type: ignore[attr-defined,union-attr]
+            .limit(count - threshold)
+        )
+        old_ids = list(self.session.exec(subquery).all())
+        if old_ids:
+            delete_statement = delete(ToolSnapshot).where(
+                ToolSnapshot.id.in_(old_ids)  # type: ignore[union-attr]
+            )
+            self.session.exec(delete_statement)
+        return len(old_ids)
+
     def get_snapshots_by_tool(
         self,
         tool_id: int,
@@ -115,7 +191,7 @@ class SnapshotRepository:
         statement = (
             select(ToolSnapshot)
             .where(ToolSnapshot.tool_id == tool_id)
-            .order_by(ToolSnapshot.created_at.desc())  # type: ignore[attr-defined]
+            .order_by(ToolSnapshot.created_at.desc(), ToolSnapshot.id.desc())  # type: ignore[attr-defined,union-attr]
             .limit(limit)
         )
         return list(self.session.exec(statement).all())
@@ -2,6 +2,7 @@ import os
 import shutil
 import uuid
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from sqlalchemy import Column, Float, Integer, MetaData, String, Table, cast, update
@@ -27,6 +28,27 @@ class SortOrder(str, Enum):
     UPDATED_DESC = "updated_desc"
 
 
+# FTS5 検索語の変換テーブル
+# 0x20未満の制御文字（\t, \n, null byte等）はSQLiteエラーの原因となり検索クエリでは不要なので除去し、
+# ダブルクォートは "" にエスケープする
+_FTS5_TERM_TRANSLATION = str.maketrans({**dict.fromkeys(range(0x20)), ord('"'): '""'})
+# 制御文字のみを除去する変換テーブル（タグ検索で索引を使えるかの長さ判定用）
+_CONTROL_CHAR_TRANSLATION = str.maketrans(dict.fromkeys(range(0x20)))
+
+# trigram トークナイザーが索引する文字数（これより短いタグ検索は索引を使えない）
+_TRIGRAM_LENGTH = 3
+
+# エスケープ結果をキャッシュする検索語の数（オートコンプリート等で同じ語が繰り返し検索される）
+_FTS5_TERM_CACHE_SIZE = 4096
+
+# FTS仮想テーブルをTableオブジェクトとして定義 (rankカラムも定義)
+# 呼び出しごとに作り直すとSQLAlchemyのコンパイル済みSQLキャッシュに当たらないため、モジュールで1度だけ定義する
+_FTS_METADATA = MetaData()
+_TOOL_FTS_TABLE = Table("tool_fts", _FTS_METADATA, Column("rowid", Integer), Column("rank", Float))
+_TOOL_TAGS_FTS_TABLE = Table("tool_tags_fts", _FTS_METADATA, Column("rowid", Integer), Column("tags", String))
+
+
+@lru_cache(maxsize=_FTS5_TERM_CACHE_SIZE)
 def _escape_fts5_term(term: str) -> str:
     """Escape special characters for FTS5 query.
 
@@ -46,23 +68,19 @@ def _escape_fts5_term(term: str) -> str:
     if not term or not term.strip():
         return ""
 
-    # 制御文字を除去（null byte等がSQLiteエラーの原因となる）
-    # 0x20未満の制御文字（\t, \n, null byte等）は検索クエリでは不要なので除去
-    term = "".join(c for c in term if ord(c) >= 0x20)
+    # 制御文字の除去とダブルクォートのエスケープを1回の変換で行う
+    escaped = term.translate(_FTS5_TERM_TRANSLATION)
 
     # 既に末尾が * の場合は除去（後で追加するため）
-    term = term.rstrip("*")
-    if not term:
+    escaped = escaped.rstrip("*")
+    if not escaped:
         return ""
 
     # 不完全なフィールドプレフィックス（例: "tag:", "name:"）をスキップ
     # これらはFTS5でカラム指定子として解釈されエラーの原因となる
-    if term.endswith(":") and term[:-1].isalpha():
+    if escaped.endswith(":") and escaped[:-1].isalpha():
         return ""
 
-    # ダブルクォートをエスケープ
-    escaped = term.replace('"', '""')
-
     # ダブルクォートで囲んで、接頭辞検索用の * を追加
     return f'"{escaped}"*'
 
@@ -160,29 +178,36 @@ class ToolRepository:
                 terms = " OR ".join(escaped_terms)
                 fts_query_parts.append(f"description:{terms}")
 
-        # FTS仮想テーブルをTableオブジェクトとして定義 (rankカラムも定義)
-        fts_metadata = MetaData()
-        tool_fts_table = Table("tool_fts", fts_metadata, Column("rowid", Integer), Column("rank", Float))
-
+        # ソートで参照する rank カラム（FTS検索時のみ）
+        fts_rank: ColumnElement[float] | None = None
         if fts_query_parts:
-            fts_match_query = " ".join(fts_query_parts)
-            join_condition: ColumnElement[bool] = Tool.id == tool_fts_table.c.rowid  # type: ignore[assignment]
-            statement = (
-                statement.join(tool_fts_table, join_condition)
-                .where(text(f"{tool_fts_table.name} MATCH :fts_query"))
-                .params(fts_query=fts_match_query)
-            )
-
-        # タグ検索条件（LIKEワイルドカード文字をエスケープ）
+            fts_match = text(f"{_TOOL_FTS_TABLE.name} MATCH :fts_query").bindparams(fts_query=" ".join(fts_query_parts))
+            if parsed_query.get("tag"):
+                # tool テーブル側の条件と MATCH が同じ WHERE にあると、プランナーが FTS インデックスを
+                # 使わない計画を選ぶことがあるため、一致する rowid を先に CTE で確定させてから結合する
+                fts_matches = (
+                    select(_TOOL_FTS_TABLE.c.rowid, _TOOL_FTS_TABLE.c.rank)
+                    .where(fts_match)
+                    .cte("fts_matches")
+                    .prefix_with("MATERIALIZED")
+                )
+                join_condition: ColumnElement[bool] = Tool.id == fts_matches.c.rowid  # type: ignore[assignment]
+                statement = statement.join(fts_matches, join_condition)
+                fts_rank = fts_matches.c.rank
+            else:
+                join_condition = Tool.id == _TOOL_FTS_TABLE.c.rowid  # type: ignore[assignment]
+                statement = statement.join(_TOOL_FTS_TABLE, join_condition).where(fts_match)
+                fts_rank = _TOOL_FTS_TABLE.c.rank
+
+        # タグ検索条件（部分一致）
         if parsed_query.get("tag"):
             for tag_query in parsed_query["tag"]:
-                escaped_tag = self._escape_like_pattern(tag_query)
-                statement = statement.where(cast(Tool.tags, String).like(f"%{escaped_tag}%", escape="\\"))
+                statement = statement.where(self._tag_condition(tag_query))
 
         # ソート順
-        if sort == SortOrder.RELEVANCE and fts_query_parts:
+        if sort == SortOrder.RELEVANCE and fts_rank is not None:
             # FTSのrankは小さいほど関連性が高いので ASC
-            statement = statement.order_by(tool_fts_table.c.rank.asc())
+            statement = statement.order_by(fts_rank.asc())
         elif sort == SortOrder.NAME_ASC:
             statement = statement.order_by(Tool.name.asc())  # type: ignore[attr-defined]
         elif sort == SortOrder.NAME_DESC:
@@ -203,7 +228,9 @@ class ToolRepository:
         """Update existing tool information with optimistic locking.
 
         Uses atomic UPDATE with WHERE clause to prevent race conditions.
-        The version check and increment happen in a single SQL statement.
+        The version check and increment happen in a single SQL statement;
+        the current version is only read back when that statement matches
+        no row.
 
         Args:
             tool_id: The ID of the tool to update.
@@ -221,11 +248,6 @@ class ToolRepository:
 
         from html_tool_manager.core.exceptions import OptimisticLockError
 
-        # まず存在確認（404判定用）
-        tool = self.session.get(Tool, tool_id)
-        if not tool:
-            return None
-
         # 更新データを準備（version, updated_atはここで明示的に設定するため除外）
         tool_data = tool_update.model_dump(exclude_unset=True, exclude={"version", "updated_at"})
         new_updated_at = datetime.now(timezone.utc)
@@ -250,15 +272,15 @@ class ToolRepository:
         # 影響を受けた行数をチェック
         # DML文の実行結果はCursorResultでrowcountを持つ
         if result.rowcount == 0:  # type: ignore[attr-defined]
-            # 存在確認済みなので、0行 = バージョン不一致
-            # toolオブジェクトはUPDATE前に取得したものなので、
-            # refreshでDBから最新のバージョンを再取得する
-            self.session.refresh(tool)
-            raise OptimisticLockError(tool.version, expected_version)
+            # 0行 = 存在しないかバージョン不一致
+            # 成功時に余分な存在確認をしないよう、失敗時にだけ現在のバージョンを取得して判定する
+            current_version = self.session.exec(select(Tool.version).where(Tool.id == tool_id)).first()
+            if current_version is None:
+                return None
+            raise OptimisticLockError(current_version, expected_version)
 
         # 更新後のツールを取得して返す
-        self.session.refresh(tool)
-        return tool
+        return self.session.get(Tool, tool_id)
 
     def delete_tool(self, tool_id: int) -> Optional[Tool]:
         """Delete a tool and its associated files."""
@@ -283,6 +305,10 @@ class ToolRepository:
                 if not is_path_within_base(tool_dir, tools_dir):
                     # パストラバーサル攻撃の可能性 - 削除をスキップ
                     pass
+                elif os.path.realpath(tool_dir) == os.path.realpath(tools_dir):
+                    # tools_dir 直下のファイルはファイルのみ削除（tools_dir ごと消さない）
+                    if os.path.isfile(filepath):
+                        os.remove(filepath)
                 elif os.path.exists(tool_dir) and os.path.isdir(tool_dir):
                     shutil.rmtree(tool_dir)
             except OSError:
@@ -291,6 +317,34 @@ class ToolRepository:
 
         return tool
 
+    def _tag_condition(self, tag_query: str) -> ColumnElement[bool]:
+        """Build the condition matching tools whose tags contain the query.
+
+        Queries of at least three characters are looked up in the trigram
+        index. Shorter ones cannot be expressed as a trigram and fall back to
+        a LIKE scan over the tags column.
+
+        Args:
+            tag_query: The substring to search for in the tags.
+
+        Returns:
+            A WHERE condition for the tool table.
+
+        """
+        # 長さはエスケープ前に判定する（ダブルクォートを "" にすると文字数が増えるため）
+        stripped = tag_query.translate(_CONTROL_CHAR_TRANSLATION)
+        if len(stripped) >= _TRIGRAM_LENGTH:
+            # ダブルクォートのエスケープ（FTS5 のフレーズとして扱う）
+            phrase = stripped.replace('"', '""')
+            matching_ids = select(_TOOL_TAGS_FTS_TABLE.c.rowid).where(
+                _TOOL_TAGS_FTS_TABLE.c.tags.op("MATCH")(f'"{phrase}"')
+            )
+            return Tool.id.in_(matching_ids)  # type: ignore[union-attr,no-any-return]
+
+        # LIKEワイルドカード文字をエスケープ
+        escaped_tag = self._escape_like_pattern(tag_query)
+        return cast(Tool.tags, String).like(f"%{escaped_tag}%", escape="\\")
+
     @staticmethod
     def _escape_like_pattern(value: str) -> str:
         r"""Escape special characters for SQL LIKE pattern.
@@ -1,29 +1,37 @@
 """React template generation module for wrapping JSX code in executable HTML."""
 
+import re
+
+# import/export 変換用のパターン。各変換を名前付きグループの選択肢にまとめ、1 回の走査で処理する
+_TRANSFORM_PATTERN = re.compile(
+    r"(?P<import>^import\s+.*?from\s+['\"]react(?:-dom)?['\"];?\s*$)"
+    r"|(?P<default_function>export\s+default\s+function\s+\w+)"
+    r"|(?P<default_variable>export\s+default\s+(?:const|let|var)\s+\w+\s*=)"
+    r"|(?P<default_name>^export\s+default\s+\w+;?\s*$)"
+    r"|(?P<export>^export\s+)",
+    re.MULTILINE,
+)
+
+# グループ名ごとの置換文字列
+_TRANSFORM_REPLACEMENTS = {
+    # import 文を削除（React hooks は上で定義済み）
+    "import": "",
+    # export default function Name を App に変更
+    "default_function": "function App",
+    # export default const Name = () => {} を const App = () => {} に変更
+    "default_variable": "const App =",
+    # 単独の export default Name; を削除（関数宣言は別の場所にある想定）
+    # この場合、元の関数名がそのまま使われるので App へのリネームは別途必要
+    "default_name": "",
+    # 他の export 文も削除
+    "export": "",
+}
 
-def generate_react_html(jsx_code: str) -> str:
-    """JSX コードを実行可能な HTML でラップする。
-
-    React 18 と ReactDOM を CDN から読み込み、Babel Standalone を使って
-    JSX をブラウザ上でトランスパイルします。
-
-    Args:
-        jsx_code: ユーザーが貼り付けた JSX コード
-
-    Returns:
-        完全な HTML ドキュメント
-
-    """
-    # import/export 文を変換
-    transformed_code = _transform_imports_exports(jsx_code)
-
-    # XSS対策: </script> をエスケープしてHTMLインジェクションを防止
-    # JavaScript では <\/script> は </script> と同じ文字列として解釈されるが、
-    # HTMLパーサーはscriptタグの終了として認識しない
-    transformed_code = transformed_code.replace("</script>", r"<\/script>")
-    transformed_code = transformed_code.replace("</SCRIPT>", r"<\/SCRIPT>")
+# スクリプトの終了タグ（HTML パーサーは大文字小文字を区別しない）
+_SCRIPT_CLOSE_PATTERN = re.compile(r"</script>", re.IGNORECASE)
 
-    return f"""<!DOCTYPE html>
+# 変換後のコードの前後に置く HTML（入力に依存しないため一度だけ組み立てる）
+_REACT_HTML_PREFIX = """<!DOCTYPE html>
 <html lang="ja">
 <head>
     <meta charset="UTF-8">
@@ -46,10 +54,10 @@ def generate_react_html(jsx_code: str) -> str:
         integrity="sha384-1qlE7MZPM2pHD/pBZCU/yB8UCP52RYL8bge/qNdfNBCWToySp8/M+JL2waXU4hjJ"
         crossorigin="anonymous"></script>
     <style>
-        body {{
+        body {
             margin: 0;
             font-family: system-ui, -apple-system, sans-serif;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -57,7 +65,7 @@ def generate_react_html(jsx_code: str) -> str:
     <script type="text/babel" data-type="module">
         // React を UMD グローバルから取得
         const React = window.React;
-        const {{
+        const {
             // 基本 hooks
             useState, useEffect, useContext, useReducer,
             useCallback, useMemo, useRef,
@@ -65,10 +73,12 @@ def generate_react_html(jsx_code: str) -> str:
             useLayoutEffect, useImperativeHandle, useDebugValue,
             // React 18 hooks
             useTransition, useDeferredValue, useId, useSyncExternalStore, useInsertionEffect
-        }} = React;
+        } = React;
         const ReactDOM = window.ReactDOM;
 
-{transformed_code}
+"""
+
+_REACT_HTML_SUFFIX = """
 
         // コンポーネントをレンダリング
         const rootElement = document.getElementById('root');
@@ -79,6 +89,31 @@ def generate_react_html(jsx_code: str) -> str:
 </html>"""
 
 
+def generate_react_html(jsx_code: str) -> str:
+    """JSX コードを実行可能な HTML でラップする。
+
+    React 18 と ReactDOM を CDN から読み込み、Babel Standalone を使って
+    JSX をブラウザ上でトランスパイルします。
+
+    Args:
+        jsx_code: ユーザーが貼り付けた JSX コード
+
+    Returns:
+        完全な HTML ドキュメント
+
+    """
+    # import/export 文を変換
+    transformed_code = _transform_imports_exports(jsx_code)
+
+    # XSS対策: </script> をエスケープしてHTMLインジェクションを防止
+    # JavaScript では <\/script> は </script> と同じ文字列として解釈されるが、
+    # HTMLパーサーはscriptタグの終了として認識しない
+    # 大文字小文字を問わず 1 回の走査でエスケープし、元の表記は保持する
+    transformed_code = _SCRIPT_CLOSE_PATTERN.sub(_escape_script_close, transformed_code)
+
+    return _REACT_HTML_PREFIX + transformed_code + _REACT_HTML_SUFFIX
+
+
 def _transform_imports_exports(code: str) -> str:
     """import/export 文をブラウザ対応の形式に変換する。
 
@@ -89,31 +124,17 @@ def _transform_imports_exports(code: str) -> str:
         変換後のコード
 
     """
-    import re
-
-    # import 文を削除（React hooks は上で定義済み）
-    code = re.sub(r"^import\s+.*?from\s+['\"]react['\"];?\s*$", "", code, flags=re.MULTILINE)
-    code = re.sub(r"^import\s+.*?from\s+['\"]react-dom['\"];?\s*$", "", code, flags=re.MULTILINE)
+    # どの変換も import か export を含む行が対象のため、含まなければ正規表現を走らせない
+    if "import" not in code and "export" not in code:
+        return code
+    return _TRANSFORM_PATTERN.sub(_replace_transform_match, code)
 
-    # export default function Name を App に変更
-    code = re.sub(
-        r"export\s+default\s+function\s+(\w+)",
-        r"function App",
-        code,
-    )
 
-    # export default const Name = () => {} を const App = () => {} に変更
-    code = re.sub(
-        r"export\s+default\s+(const|let|var)\s+\w+\s*=",
-        r"const App =",
-        code,
-    )
+def _replace_transform_match(match: re.Match[str]) -> str:
+    """Return the replacement for a match of _TRANSFORM_PATTERN."""
+    return _TRANSFORM_REPLACEMENTS[match.lastgroup or ""]
 
-    # 単独の export default Name; を削除（関数宣言は別の場所にある想定）
-    # この場合、元の関数名がそのまま使われるので App へのリネームは別途必要
-    code = re.sub(r"^export\s+default\s+\w+;?\s*$", "", code, flags=re.MULTILINE)
-
-    # 他の export 文も削除
-    code = re.sub(r"^export\s+", "", code, flags=re.MULTILINE)
 
-    return code
+def _escape_script_close(match: re.Match[str]) -> str:
+    """Escape a closing script tag while keeping its original case."""
+    return "<\\/" + match.group(0)[2:]
@@ -4,6 +4,36 @@ import re
 
 from html_tool_manager.models.tool import ToolType
 
+# HTML ドキュメントのパターン（React コードでは全体を走査することになるため、1 回で済むよう 1 つにまとめる）
+_HTML_PATTERN = re.compile(
+    "|".join(
+        (
+            r"<!DOCTYPE\s+html>",
+            r"<html[>\s]",
+            r"<head[>\s]",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# React の特徴的なパターン
+_REACT_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"import\s+React",  # React import
+        r"from\s+['\"]react['\"]",  # from 'react'
+        r"useState|useEffect|useContext|useReducer|useMemo|useCallback",  # React Hooks
+        r"ReactDOM\.render|createRoot",  # ReactDOM
+        r"<[A-Z]\w+\s+",  # JSX Component (大文字で始まる)
+        r"<\w+\s+\w+={",  # JSX props with expressions
+        r"function\s+\w+\s*\([^)]*\)\s*{\s*return\s*\(",  # Function component pattern
+        r"const\s+\w+\s*=\s*\([^)]*\)\s*=>\s*{",  # Arrow function component
+    )
+)
+
+# React と判定するのに必要なパターンのマッチ数
+_REACT_MATCH_THRESHOLD = 2
+
 
 def detect_tool_type(code: str) -> ToolType:
     """コードを解析してツールタイプを自動検出する。
@@ -20,33 +50,17 @@ def detect_tool_type(code: str) -> ToolType:
         検出されたツールタイプ
 
     """
-    # HTML ドキュメントのパターン
-    html_patterns = [
-        r"<!DOCTYPE\s+html>",
-        r"<html[>\s]",
-        r"<head[>\s]",
-    ]
-
-    # React の特徴的なパターン
-    react_patterns = [
-        r"import\s+React",  # React import
-        r"from\s+['\"]react['\"]",  # from 'react'
-        r"useState|useEffect|useContext|useReducer|useMemo|useCallback",  # React Hooks
-        r"ReactDOM\.render|createRoot",  # ReactDOM
-        r"<[A-Z]\w+\s+",  # JSX Component (大文字で始まる)
-        r"<\w+\s+\w+={",  # JSX props with expressions
-        r"function\s+\w+\s*\([^)]*\)\s*{\s*return\s*\(",  # Function component pattern
-        r"const\s+\w+\s*=\s*\([^)]*\)\s*=>\s*{",  # Arrow function component
-    ]
-
     # HTML ドキュメントとして完全な場合は HTML
-    if any(re.search(pattern, code, re.IGNORECASE) for pattern in html_patterns):
+    if _HTML_PATTERN.search(code):
         return ToolType.HTML
 
-    # React パターンが複数マッチする場合は React
-    react_matches = sum(1 for pattern in react_patterns if re.search(pattern, code))
-    if react_matches >= 2:  # 2つ以上のパターンにマッチ
-        return ToolType.REACT
+    # React パターンが複数マッチする場合は React（閾値に達した時点で残りは走査しない）
+    react_matches = 0
+    for pattern in _REACT_PATTERNS:
+        if pattern.search(code):
+            react_matches += 1
+            if react_matches >= _REACT_MATCH_THRESHOLD:
+                return ToolType.REACT
 
     # デフォルトは HTML
     return ToolType.HTML
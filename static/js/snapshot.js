@@ -7,7 +7,6 @@ const DIFF2HTML_CSS =
   'https://cdn.jsdelivr.net/npm/diff2html/bundles/css/diff2html.min.css';
 const DIFF2HTML_JS =
   'https://cdn.jsdelivr.net/npm/diff2html/bundles/js/diff2html-ui.min.js';
-const DIFF_JS = 'https://cdn.jsdelivr.net/npm/diff/dist/diff.min.js';
 
 let diff2htmlLoaded = false;
 
@@ -55,9 +54,6 @@ async function loadDiff2Html() {
   // CSS読み込み
   loadCSS(DIFF2HTML_CSS);
 
-  // diff.js読み込み
-  await loadScript(DIFF_JS);
-
   // diff2html-ui.js読み込み
   await loadScript(DIFF2HTML_JS);
 
@@ -281,19 +277,14 @@ async function showDiff(toolId, snapshotId) {
 
     const data = await response.json();
 
-    // diff.js で unified diff を生成
-    const diff = Diff.createTwoFilesPatch(
-      'snapshot',
-      'current',
-      data.old_content,
-      data.new_content,
-      `スナップショット #${snapshotId}`,
-      '現在の内容',
-    );
+    if (data.equal) {
+      diffViewer.innerHTML = '<p>現在の内容との差分はありません。</p>';
+      return;
+    }
 
-    // diff2html で表示
+    // サーバーが生成した unified diff を diff2html で表示
     diffViewer.innerHTML = '';
-    const diff2htmlUi = new Diff2HtmlUI(diffViewer, diff, {
+    const diff2htmlUi = new Diff2HtmlUI(diffViewer, data.diff, {
       drawFileList: false,
       matching: 'lines',
       outputFormat: 'side-by-side',
@@ -1,74 +1,223 @@
+import os
+import shutil
+import sqlite3
+import uuid
+from collections.abc import Callable, Generator
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, SQLModel, StaticPool, create_engine
+from sqlalchemy import Connection, Engine, event
+from sqlmodel import Session, StaticPool, col, create_engine, select
 
+from html_tool_manager import main as main_module
 from html_tool_manager.core import config as core_config
 from html_tool_manager.core import db as core_db
 from html_tool_manager.core.db import get_session
 from html_tool_manager.main import app
+from html_tool_manager.models import Tool
+from html_tool_manager.models.tool import ToolType
 
-# Use an in-memory SQLite database for testing with a static connection pool
-# グローバルスコープの engine 定義は削除
-# SQLALCHEMY_DATABASE_URL = "sqlite://"
-# engine = create_engine(
-#     SQLALCHEMY_DATABASE_URL,
-#     connect_args={"check_same_thread": False},
-#     poolclass=StaticPool,
-# )
+# tmpfs 上に一時ディレクトリを置くとファイル I/O と SQLite の fsync がディスクに出ない
+_TMPFS_ROOT = Path("/dev/shm")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Place tmp_path directories on tmpfs when it is available.
+
+    An explicit --basetemp or PYTEST_DEBUG_TEMPROOT is left untouched.
+    """
+    if config.option.basetemp or "PYTEST_DEBUG_TEMPROOT" in os.environ:
+        return
+    if _TMPFS_ROOT.is_dir() and os.access(_TMPFS_ROOT, os.W_OK | os.X_OK):
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = str(_TMPFS_ROOT)
+
+
+# テスト中のトランザクションを張っている接続（session フィクスチャが設定する）
+_active_connection: dict[str, Connection] = {}
 
 
 def override_get_session():
-    """Yield a test session using the engine set by client_fixture."""
-    with Session(core_db.engine) as session:
+    """Yield a session joined to the current test's transaction.
+
+    Commits made by the request only release a SAVEPOINT, so everything is
+    rolled back when the test's session fixture tears down.
+    """
+    connection = _active_connection.get("connection")
+    if connection is None:
+        with Session(core_db.engine) as session:
+            yield session
+        return
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
         yield session
 
 
 app.dependency_overrides[get_session] = override_get_session
 
 
-@pytest.fixture(name="session")
-def session_fixture():
-    """Create a new database engine and session for each test."""
+@pytest.fixture(scope="session")
+def engine() -> Generator[Engine, None, None]:
+    """Create the in-memory test database and its schema once per session.
+
+    StaticPool keeps a single connection, so every session and request sees the
+    same in-memory database without any disk I/O.
+    """
     engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
 
-    # グローバルなエンジンをテスト用に差し替え
+    # pysqlite の暗黙的なトランザクション制御を止め、SAVEPOINT が正しく動くようにする
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # グローバルなエンジンをテスト用に差し替え（ヘルスチェックは main.engine を参照する）
     original_core_engine = core_db.engine
+    original_main_engine = main_module.engine
     core_db.engine = engine
+    main_module.engine = engine
 
-    # テーブル作成
+    # テーブル作成（セッション中に1回だけ）
     core_db.create_db_and_tables()
 
-    with Session(engine) as session:
-        yield session
+    yield engine
 
-    # テスト後にテーブルを破棄
-    SQLModel.metadata.drop_all(engine)
     core_db.engine = original_core_engine
+    main_module.engine = original_main_engine
+    engine.dispose()
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine: Engine) -> Generator[Session, None, None]:
+    """Run each test inside a transaction that is rolled back afterwards."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    _active_connection["connection"] = connection
+
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
+        yield session
+
+    # テスト後にロールバックしてデータを破棄
+    del _active_connection["connection"]
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def shared_client() -> TestClient:
+    """Create the TestClient once per session.
+
+    It is not entered as a context manager, so the app lifespan never runs.
+    """
+    return TestClient(app)
 
 
 @pytest.fixture(name="client")
-def client_fixture(session: Session):
-    """Create a test client that depends on the session fixture."""
-    client = TestClient(app)
-    yield client
+def client_fixture(session: Session, shared_client: TestClient) -> TestClient:
+    """Return the shared test client; depends on session for per-test isolation."""
+    return shared_client
+
+
+@pytest.fixture
+def client_no_db_reset(engine: Engine, shared_client: TestClient) -> TestClient:
+    """Return the shared test client without a per-test transaction.
+
+    For tests that never write to the database, such as the health check.
+    """
+    return shared_client
+
+
+@pytest.fixture(scope="session")
+def tools_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the temporary tools directory shared by the whole session.
+
+    Tool files are created under uuid-named paths, so tests sharing the
+    directory never collide, and module-scoped fixtures can place files in it.
+    """
+    return tmp_path_factory.mktemp("tools")
 
 
 @pytest.fixture(name="test_tools_dir")
-def test_tools_dir_fixture(tmp_path: Path):
+def test_tools_dir_fixture(tools_root: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     """Override tools_dir with a temporary directory for testing.
 
     This prevents tests from polluting the production static/tools directory.
     """
-    tools_dir = tmp_path / "tools"
-    tools_dir.mkdir()
+    monkeypatch.setattr(core_config.app_settings, "tools_dir", str(tools_root))
+    return tools_root
+
 
-    # Override app_settings.tools_dir
-    original_tools_dir = core_config.app_settings.tools_dir
-    core_config.app_settings.tools_dir = str(tools_dir)
+@pytest.fixture
+def make_tools(session: Session, test_tools_dir: Path) -> Callable[[list[dict[str, Any]]], list[int]]:
+    """Return a helper that seeds tools directly through the session.
 
-    yield tools_dir
+    Each spec is a dict of Tool fields plus ``html_content``, which is written
+    to a file under the test tools directory. Rows go in through a single
+    ``bulk_insert_mappings`` call and one commit, skipping both the API
+    round-trip and ORM instance creation per tool.
+    """
 
-    # Restore original value
-    core_config.app_settings.tools_dir = original_tools_dir
+    def _make_tools(specs: list[dict[str, Any]]) -> list[int]:
+        now = datetime.now(timezone.utc)
+        mappings = []
+        for spec in specs:
+            fields = dict(spec)
+            filepath = test_tools_dir / f"{uuid.uuid4()}.html"
+            filepath.write_text(fields.pop("html_content", ""), encoding="utf-8")
+            # bulk_insert_mappings はモデルの default_factory を通らないため既定値を明示する
+            mappings.append(
+                {
+                    "tags": [],
+                    "tool_type": ToolType.HTML,
+                    "version": 1,
+                    "created_at": now,
+                    "updated_at": now,
+                    **fields,
+                    "filepath": str(filepath),
+                }
+            )
+        session.bulk_insert_mappings(Tool, mappings)
+        session.commit()
+        # ファイルパスは一意なので、1回の SELECT で id を引き当てる
+        filepaths = [mapping["filepath"] for mapping in mappings]
+        ids = dict(session.exec(select(Tool.filepath, Tool.id).where(col(Tool.filepath).in_(filepaths))).all())
+        return [ids[filepath] for filepath in filepaths]
+
+    return _make_tools
+
+
+def _create_test_database(db_path: Path) -> None:
+    """Create a simple SQLite database for backup tests."""
+    conn = sqlite3.connect(str(db_path), isolation_level=None)
+    try:
+        # スキーマとデータを1トランザクションで書き込み、ジャーナルの書き出しを1回にする
+        conn.execute("BEGIN")
+        conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, value TEXT)")
+        conn.executemany("INSERT INTO test (value) VALUES (?)", [("test data",)])
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+@pytest.fixture(scope="session")
+def backup_template_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the backup test database once per session."""
+    db_path = tmp_path_factory.mktemp("backup_template") / "template.db"
+    _create_test_database(db_path)
+    return db_path
+
+
+@pytest.fixture
+def backup_test_db(tmp_path: Path, backup_template_db: Path) -> Path:
+    """Copy the template database into the test's temporary directory.
+
+    shutil.copyfile uses the kernel's zero-copy path on Linux, so this is
+    much cheaper than rebuilding the schema for every test.
+    """
+    db_path = tmp_path / "test.db"
+    shutil.copyfile(backup_template_db, db_path)
+    return db_path
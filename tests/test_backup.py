@@ -2,9 +2,11 @@
 
 import sqlite3
 import time
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
+from sqlmodel import Session, SQLModel, create_engine
 
 from html_tool_manager.core.backup import (
     BACKUP_FILENAME_PATTERN,
@@ -14,23 +16,25 @@ from html_tool_manager.core.backup import (
     BackupService,
     InvalidFilenameError,
 )
-
-
-def _create_test_database(db_path: Path) -> None:
-    """Create a simple SQLite database for testing."""
-    with sqlite3.connect(str(db_path)) as conn:
-        conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, value TEXT)")
-        conn.execute("INSERT INTO test (value) VALUES ('test data')")
-        conn.commit()
+from html_tool_manager.core.db import create_db_and_tables
+from html_tool_manager.models.tool import Tool
+from html_tool_manager.repositories.tool_repository import ToolRepository
 
 
 @pytest.fixture
-def backup_service(tmp_path: Path) -> BackupService:
+def backup_service(tmp_path: Path, backup_test_db: Path) -> BackupService:
     """Create a BackupService with temporary directories."""
-    db_path = tmp_path / "test.db"
-    _create_test_database(db_path)
     backup_dir = tmp_path / "backups"
-    return BackupService(str(db_path), str(backup_dir), max_generations=3)
+    return BackupService(str(backup_test_db), str(backup_dir), max_generations=3)
+
+
+@pytest.fixture
+def backup_service_without_db(tmp_path: Path) -> BackupService:
+    """Create a BackupService for tests that never read the database.
+
+    The database path is never materialized, which skips the template copy.
+    """
+    return BackupService(str(tmp_path / "test.db"), str(tmp_path / "backups"), max_generations=3)
 
 
 class TestBackupFilenamePattern:
@@ -86,6 +90,16 @@ class TestBackupInfo:
         )
         assert "5.0 MB" == info.size_human
 
+    def test_size_human_caps_at_terabytes(self, tmp_path: Path) -> None:
+        """Sizes beyond the largest unit should stay in TB."""
+        info = BackupInfo(
+            filename="test.db",
+            filepath=tmp_path / "test.db",
+            created_at=None,  # type: ignore[arg-type]
+            size_bytes=2048 * 1024 * 1024 * 1024 * 1024,
+        )
+        assert "2048.0 TB" == info.size_human
+
 
 class TestBackupServiceCreateBackup:
     """Tests for BackupService.create_backup method."""
@@ -134,9 +148,9 @@ class TestBackupServiceCreateBackup:
 class TestBackupServiceListBackups:
     """Tests for BackupService.list_backups method."""
 
-    def test_list_backups_empty(self, backup_service: BackupService) -> None:
+    def test_list_backups_empty(self, backup_service_without_db: BackupService) -> None:
         """List should be empty when no backups exist."""
-        result = backup_service.list_backups()
+        result = backup_service_without_db.list_backups()
         assert result == []
 
     def test_list_backups_returns_backups(self, backup_service: BackupService) -> None:
@@ -155,16 +169,29 @@ class TestBackupServiceListBackups:
         assert len(result) == 2
         assert result[0].created_at >= result[1].created_at
 
-    def test_list_backups_ignores_invalid_files(self, backup_service: BackupService) -> None:
+    def test_list_backups_ignores_invalid_files(self, backup_service_without_db: BackupService) -> None:
         """List should ignore files that don't match the pattern."""
-        backup_service.backup_dir.mkdir(parents=True)
-        (backup_service.backup_dir / "invalid_backup.db").write_text("test")
-        (backup_service.backup_dir / "tools_20250114_153042.db").write_text("valid")
+        backup_service_without_db.backup_dir.mkdir(parents=True)
+        (backup_service_without_db.backup_dir / "invalid_backup.db").write_text("test")
+        (backup_service_without_db.backup_dir / "tools_20250114_153042.db").write_text("valid")
 
-        result = backup_service.list_backups()
+        result = backup_service_without_db.list_backups()
         assert len(result) == 1
         assert result[0].filename == "tools_20250114_153042.db"
 
+    def test_list_backups_uses_filename_timestamp(self, backup_service_without_db: BackupService) -> None:
+        """Order and created_at should come from the filename, not the file mtime."""
+        backup_service_without_db.backup_dir.mkdir(parents=True)
+        older = backup_service_without_db.backup_dir / "tools_20250101_000000.db"
+        newer = backup_service_without_db.backup_dir / "tools_20250102_000000.db"
+        newer.write_text("newer")
+        older.write_text("older")  # written last, so it has the newer mtime
+
+        result = backup_service_without_db.list_backups()
+
+        assert [b.filename for b in result] == [newer.name, older.name]
+        assert result[0].created_at == datetime(2025, 1, 2, tzinfo=timezone.utc)
+
 
 class TestBackupServiceRotation:
     """Tests for backup rotation functionality."""
@@ -218,26 +245,49 @@ class TestBackupServiceRestore:
             restored_data = conn.execute("SELECT value FROM test WHERE id = 1").fetchone()
         assert restored_data[0] == "test data"
 
-    def test_restore_backup_not_found(self, backup_service: BackupService) -> None:
+    def test_restore_pre_tag_fts_backup_supports_tag_search(self, tmp_path: Path) -> None:
+        """Tag search should work after restoring a backup taken before tool_tags_fts existed."""
+        db_path = tmp_path / "tools.db"
+        engine = create_engine(f"sqlite:///{db_path}")
+        # FTS テーブルを持たない古いスキーマのデータベースをバックアップする
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(Tool(name="Old Tool", tags=["utility"], filepath="static/tools/1/index.html"))
+            session.commit()
+        service = BackupService(str(db_path), str(tmp_path / "backups"), max_generations=3)
+        backup = service.create_backup()
+        create_db_and_tables(engine)
+
+        service.restore_backup(backup.filename)
+        # 復元 API と同じ手順で接続を破棄し、スキーマを補う
+        engine.dispose()
+        create_db_and_tables(engine)
+
+        with Session(engine) as session:
+            results = ToolRepository(session).search_tools({"tag": ["util"]})
+        assert [tool.name for tool in results] == ["Old Tool"]
+        engine.dispose()
+
+    def test_restore_backup_not_found(self, backup_service_without_db: BackupService) -> None:
         """Restore should fail with nonexistent backup."""
-        backup_service.backup_dir.mkdir(parents=True)
+        backup_service_without_db.backup_dir.mkdir(parents=True)
         with pytest.raises(BackupNotFoundError):
-            backup_service.restore_backup("tools_20250114_153042.db")
+            backup_service_without_db.restore_backup("tools_20250114_153042.db")
 
-    def test_restore_invalid_filename_path_traversal(self, backup_service: BackupService) -> None:
+    def test_restore_invalid_filename_path_traversal(self, backup_service_without_db: BackupService) -> None:
         """Restore should reject path traversal attempts."""
         with pytest.raises(InvalidFilenameError):
-            backup_service.restore_backup("../../../etc/passwd")
+            backup_service_without_db.restore_backup("../../../etc/passwd")
 
-    def test_restore_invalid_filename_slash(self, backup_service: BackupService) -> None:
+    def test_restore_invalid_filename_slash(self, backup_service_without_db: BackupService) -> None:
         """Restore should reject filenames with slashes."""
         with pytest.raises(InvalidFilenameError):
-            backup_service.restore_backup("subdir/tools_20250114_153042.db")
+            backup_service_without_db.restore_backup("subdir/tools_20250114_153042.db")
 
-    def test_restore_invalid_filename_pattern(self, backup_service: BackupService) -> None:
+    def test_restore_invalid_filename_pattern(self, backup_service_without_db: BackupService) -> None:
         """Restore should reject filenames that don't match pattern."""
         with pytest.raises(InvalidFilenameError):
-            backup_service.restore_backup("malicious.db")
+            backup_service_without_db.restore_backup("malicious.db")
 
 
 class TestBackupServiceDelete:
@@ -253,42 +303,42 @@ class TestBackupServiceDelete:
         assert result is True
         assert not backup.filepath.exists()
 
-    def test_delete_backup_not_found(self, backup_service: BackupService) -> None:
+    def test_delete_backup_not_found(self, backup_service_without_db: BackupService) -> None:
         """Delete should fail with nonexistent backup."""
-        backup_service.backup_dir.mkdir(parents=True)
+        backup_service_without_db.backup_dir.mkdir(parents=True)
         with pytest.raises(BackupNotFoundError):
-            backup_service.delete_backup("tools_20250114_153042.db")
+            backup_service_without_db.delete_backup("tools_20250114_153042.db")
 
-    def test_delete_invalid_filename(self, backup_service: BackupService) -> None:
+    def test_delete_invalid_filename(self, backup_service_without_db: BackupService) -> None:
         """Delete should reject invalid filenames."""
         with pytest.raises(InvalidFilenameError):
-            backup_service.delete_backup("../malicious.db")
+            backup_service_without_db.delete_backup("../malicious.db")
 
 
 class TestBackupServiceValidateFilename:
     """Tests for filename validation."""
 
-    def test_validate_valid_filename(self, backup_service: BackupService) -> None:
+    def test_validate_valid_filename(self, backup_service_without_db: BackupService) -> None:
         """Valid filename should pass validation."""
         # Should not raise
-        backup_service._validate_filename("tools_20250114_153042.db")
+        backup_service_without_db._validate_filename("tools_20250114_153042.db")
 
-    def test_validate_path_traversal_dotdot(self, backup_service: BackupService) -> None:
+    def test_validate_path_traversal_dotdot(self, backup_service_without_db: BackupService) -> None:
         """Path traversal with .. should be rejected."""
         with pytest.raises(InvalidFilenameError, match="path traversal"):
-            backup_service._validate_filename("..tools_20250114_153042.db")
+            backup_service_without_db._validate_filename("..tools_20250114_153042.db")
 
-    def test_validate_path_traversal_forward_slash(self, backup_service: BackupService) -> None:
+    def test_validate_path_traversal_forward_slash(self, backup_service_without_db: BackupService) -> None:
         """Path traversal with / should be rejected."""
         with pytest.raises(InvalidFilenameError, match="path traversal"):
-            backup_service._validate_filename("foo/tools_20250114_153042.db")
+            backup_service_without_db._validate_filename("foo/tools_20250114_153042.db")
 
-    def test_validate_path_traversal_backslash(self, backup_service: BackupService) -> None:
+    def test_validate_path_traversal_backslash(self, backup_service_without_db: BackupService) -> None:
         r"""Path traversal with \\ should be rejected."""
         with pytest.raises(InvalidFilenameError, match="path traversal"):
-            backup_service._validate_filename("foo\\tools_20250114_153042.db")
+            backup_service_without_db._validate_filename("foo\\tools_20250114_153042.db")
 
-    def test_validate_invalid_pattern(self, backup_service: BackupService) -> None:
+    def test_validate_invalid_pattern(self, backup_service_without_db: BackupService) -> None:
         """Filename not matching pattern should be rejected."""
         with pytest.raises(InvalidFilenameError, match="must match"):
-            backup_service._validate_filename("random_file.db")
+            backup_service_without_db._validate_filename("random_file.db")
@@ -1,8 +1,8 @@
 """Integration tests for backup API endpoints."""
 
-import sqlite3
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -11,28 +11,42 @@ from html_tool_manager.core.backup import BackupService
 from html_tool_manager.main import app
 
 
+class _NullScheduler:
+    """No-op stand-in for the APScheduler scheduler stored on app.state."""
+
+    running = False
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        return lambda *args, **kwargs: None
+
+
 @pytest.fixture
-def mock_backup_service(tmp_path: Path) -> BackupService:
+def mock_backup_service(tmp_path: Path, backup_test_db: Path) -> BackupService:
     """Create a mock backup service with temporary directories."""
-    db_path = tmp_path / "test.db"
-    # Create actual SQLite database
-    with sqlite3.connect(str(db_path)) as conn:
-        conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, value TEXT)")
-        conn.execute("INSERT INTO test (value) VALUES ('test data')")
-        conn.commit()
-
     backup_dir = tmp_path / "backups"
-    return BackupService(str(db_path), str(backup_dir), max_generations=3)
+    return BackupService(str(backup_test_db), str(backup_dir), max_generations=3)
+
+
+@pytest.fixture(scope="module")
+def backup_api_client() -> TestClient:
+    """Create a single test client shared by the tests in this module.
+
+    The client is not entered as a context manager, so the app lifespan
+    (database setup, startup backup, scheduler) never runs.
+    """
+    return TestClient(app, raise_server_exceptions=False)
 
 
 @pytest.fixture
-def client_with_backup(mock_backup_service: BackupService) -> TestClient:
-    """Create a test client with mock backup service."""
+def client_with_backup(backup_api_client: TestClient, mock_backup_service: BackupService) -> TestClient:
+    """Return the shared test client wired to a mock backup service."""
     app.state.backup_service = mock_backup_service
-    # Mock scheduler to avoid starting it
-    app.state.scheduler = MagicMock()
-    client = TestClient(app, raise_server_exceptions=False)
-    yield client
+    # Stub scheduler to avoid starting it
+    app.state.scheduler = _NullScheduler()
+    yield backup_api_client
+    # 後続のテストに状態を持ち越さない
+    del app.state.backup_service
+    del app.state.scheduler
 
 
 class TestBackupAPIListBackups:
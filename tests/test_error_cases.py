@@ -59,7 +59,7 @@ def test_import_invalid_msgpack_returns_400(session: Session, client: TestClient
     assert "Invalid MessagePack file" in response.json()["detail"]
 
 
-def test_import_with_invalid_tool_data_skips_invalid(session: Session, client: TestClient):
+def test_import_with_invalid_tool_data_skips_invalid(session: Session, client: TestClient, test_tools_dir):
     """不正なツールデータを含むインポートは、不正なデータをスキップして処理することをテストする。"""
     tools_data = [
         {"name": "Valid Tool", "description": "Valid", "html_content": "<p>valid</p>"},
@@ -1,5 +1,6 @@
 """Tests for file utility functions."""
 
+import errno
 import os
 import stat
 import tempfile
@@ -7,6 +8,7 @@ from unittest.mock import patch
 
 import pytest
 
+from html_tool_manager.core import file_utils
 from html_tool_manager.core.file_utils import atomic_write_file
 
 
@@ -59,12 +61,36 @@ class TestAtomicWriteFile:
         file_mode = stat.S_IMODE(os.stat(filepath).st_mode)
         assert file_mode == 0o600
 
+    def test_skips_chmod_when_mode_already_matches(self, tmp_path):
+        """Test that fchmod is not called when the file already has the requested mode."""
+        filepath = tmp_path / "test.txt"
+
+        with (
+            patch("html_tool_manager.core.file_utils._open_unnamed_temp", return_value=None),
+            patch("os.chmod") as mock_chmod,
+        ):
+            # mkstemp creates files with mode 0o600
+            atomic_write_file(str(filepath), "content", mode=0o600)
+
+        mock_chmod.assert_not_called()
+
+    def test_fallback_works_without_fchmod(self, tmp_path, monkeypatch):
+        """Test that the mkstemp fallback does not rely on os.fchmod (missing on Windows before 3.13)."""
+        monkeypatch.delattr(os, "fchmod", raising=False)
+        filepath = tmp_path / "test.txt"
+
+        with patch("html_tool_manager.core.file_utils._open_unnamed_temp", return_value=None):
+            atomic_write_file(str(filepath), "content")
+
+        assert filepath.read_text(encoding="utf-8") == "content"
+        assert stat.S_IMODE(os.stat(filepath).st_mode) == 0o644
+
     def test_cleans_up_temp_file_on_write_error(self, tmp_path):
         """Test that temp file is cleaned up when write fails."""
         filepath = tmp_path / "test.txt"
 
-        with patch("os.fdopen") as mock_fdopen:
-            mock_fdopen.side_effect = IOError("Write failed")
+        with patch("os.write") as mock_write:
+            mock_write.side_effect = IOError("Write failed")
             with pytest.raises(IOError):
                 atomic_write_file(str(filepath), "content")
 
@@ -76,7 +102,10 @@ class TestAtomicWriteFile:
         """Test that temp file is cleaned up when chmod fails."""
         filepath = tmp_path / "test.txt"
 
-        with patch("os.chmod") as mock_chmod:
+        with (
+            patch("html_tool_manager.core.file_utils._open_unnamed_temp", return_value=None),
+            patch("os.chmod") as mock_chmod,
+        ):
             mock_chmod.side_effect = OSError("chmod failed")
             with pytest.raises(OSError):
                 atomic_write_file(str(filepath), "content")
@@ -85,6 +114,51 @@ class TestAtomicWriteFile:
         remaining_files = list(tmp_path.iterdir())
         assert len(remaining_files) == 0
 
+    def test_unnamed_temp_leaves_nothing_on_error(self, tmp_path, monkeypatch):
+        """Test that a failed O_TMPFILE write never creates a directory entry."""
+        monkeypatch.setattr(file_utils, "_unnamed_temp_supported", True)
+        filepath = tmp_path / "test.txt"
+
+        with patch("os.write") as mock_write:
+            mock_write.side_effect = OSError("Write failed")
+            with pytest.raises(OSError):
+                atomic_write_file(str(filepath), "content")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_falls_back_when_o_tmpfile_unsupported(self, tmp_path):
+        """Test that a named temp file is used when O_TMPFILE is not supported."""
+        filepath = tmp_path / "test.txt"
+        real_open = os.open
+        o_tmpfile = getattr(os, "O_TMPFILE", 0)
+
+        def fake_open(path, flags, *args, **kwargs):
+            if o_tmpfile and flags & o_tmpfile == o_tmpfile:
+                raise OSError(errno.EOPNOTSUPP, "not supported")
+            return real_open(path, flags, *args, **kwargs)
+
+        with patch("os.open", side_effect=fake_open):
+            atomic_write_file(str(filepath), "content")
+
+        assert filepath.read_text(encoding="utf-8") == "content"
+
+    def test_falls_back_when_link_unsupported_on_overwrite(self, tmp_path, monkeypatch):
+        """Test that overwriting falls back when the temporary link is unsupported."""
+        monkeypatch.setattr(file_utils, "_unnamed_temp_supported", True)
+        filepath = tmp_path / "test.txt"
+        filepath.write_text("original", encoding="utf-8")
+
+        def fake_link(src, dst, **kwargs):
+            if dst == str(filepath):
+                raise FileExistsError(errno.EEXIST, "exists")
+            raise OSError(errno.EXDEV, "cross-device link")
+
+        with patch("os.link", side_effect=fake_link):
+            atomic_write_file(str(filepath), "new content")
+
+        assert filepath.read_text(encoding="utf-8") == "new content"
+        assert list(tmp_path.iterdir()) == [filepath]
+
     def test_atomic_replacement(self, tmp_path):
         """Test that file replacement is atomic (uses os.replace)."""
         filepath = tmp_path / "test.txt"
@@ -103,15 +177,18 @@ class TestAtomicWriteFile:
         filepath = tmp_path / "test.txt"
 
         # Create a real temp file for the test before patching
-        real_fd, real_path = tempfile.mkstemp(dir=str(tmp_path), text=True)
+        real_fd, real_path = tempfile.mkstemp(dir=str(tmp_path))
 
-        with patch("html_tool_manager.core.file_utils.tempfile.mkstemp") as mock_mkstemp:
+        with (
+            patch("html_tool_manager.core.file_utils._open_unnamed_temp", return_value=None),
+            patch("html_tool_manager.core.file_utils.tempfile.mkstemp") as mock_mkstemp,
+        ):
             mock_mkstemp.return_value = (real_fd, real_path)
 
             atomic_write_file(str(filepath), "content")
 
             # Verify mkstemp was called with correct directory
-            mock_mkstemp.assert_called_once_with(dir=str(tmp_path), text=True)
+            mock_mkstemp.assert_called_once_with(dir=str(tmp_path))
 
     def test_raises_permission_error(self, tmp_path):
         """Test that PermissionError is raised when directory is not writable."""
@@ -158,6 +235,17 @@ Line 3
 
         assert filepath.read_text(encoding="utf-8") == content
 
+    def test_handles_short_writes(self, tmp_path):
+        """Test that content is fully written even if os.write writes partially."""
+        filepath = tmp_path / "test.txt"
+        content = "abcdefghij" * 100
+        real_write = os.write
+
+        with patch("os.write", side_effect=lambda fd, data: real_write(fd, data[:7])):
+            atomic_write_file(str(filepath), content)
+
+        assert filepath.read_text(encoding="utf-8") == content
+
     def test_fails_when_directory_does_not_exist(self, tmp_path):
         """Test that FileNotFoundError is raised when parent directory doesn't exist."""
         filepath = tmp_path / "nonexistent" / "test.txt"
@@ -1,114 +1,119 @@
 """Tests for Fork API endpoint."""
 
 import uuid
+from collections.abc import Generator
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import Engine
 from sqlmodel import Session
 
 from html_tool_manager.models import Tool
 from html_tool_manager.models.tool import NAME_MAX_LENGTH, ToolType
 from html_tool_manager.repositories import ToolRepository
 
-
-@pytest.fixture
-def tool_with_file(session: Session, test_tools_dir: Path) -> Tool:
-    """Create a test tool with an actual file in the test directory."""
-    tool_dir = test_tools_dir / f"test-{uuid.uuid4()}"
-    tool_dir.mkdir()
-    filepath = tool_dir / "index.html"
-
-    filepath.write_text("<html><body>Original content</body></html>", encoding="utf-8")
-
-    tool_repo = ToolRepository(session)
-    tool = Tool(
-        name="Original Tool",
-        description="Original Description",
-        tags=["original", "test"],
-        filepath=str(filepath),
-        tool_type=ToolType.HTML,
+# 全テストで tools_dir を一時ディレクトリに向ける（モジュールスコープのツールの検証に必要）
+pytestmark = pytest.mark.usefixtures("test_tools_dir")
+
+
+def _module_tool(
+    engine: Engine, tools_root: Path, prefix: str, content: str, tool: Tool
+) -> Generator[Tool, None, None]:
+    """Write a tool file and commit its row for the lifetime of a module.
+
+    The row is committed outside the per-test transaction. Fork tests never
+    modify the source tool, and it is deleted again when the module finishes.
+    """
+    filepath = tools_root / f"{prefix}-{uuid.uuid4()}.html"
+    filepath.write_text(content, encoding="utf-8")
+    tool.filepath = str(filepath)
+
+    with Session(engine) as session:
+        created = ToolRepository(session).create_tool(tool)
+
+    yield created
+
+    with Session(engine) as session:
+        ToolRepository(session).delete_tool(created.id)
+
+
+@pytest.fixture(scope="module")
+def tool_with_file(engine: Engine, tools_root: Path) -> Generator[Tool, None, None]:
+    """Create the tool forked by the tests, with its file, once per module."""
+    yield from _module_tool(
+        engine,
+        tools_root,
+        "test",
+        "<html><body>Original content</body></html>",
+        Tool(
+            name="Original Tool",
+            description="Original Description",
+            tags=["original", "test"],
+            filepath="",
+            tool_type=ToolType.HTML,
+        ),
     )
-    return tool_repo.create_tool(tool)
 
 
-@pytest.fixture
-def react_tool_with_file(session: Session, test_tools_dir: Path) -> Tool:
-    """Create a React type test tool with an actual file."""
-    tool_dir = test_tools_dir / f"react-{uuid.uuid4()}"
-    tool_dir.mkdir()
-    filepath = tool_dir / "index.html"
-
+@pytest.fixture(scope="module")
+def react_tool_with_file(engine: Engine, tools_root: Path) -> Generator[Tool, None, None]:
+    """Create a React type test tool with an actual file, once per module."""
     react_content = """<!DOCTYPE html>
 <html>
 <head><script src="https://unpkg.com/react.production.min.js"></script></head>
 <body><div id="root"></div></body>
 </html>"""
-    filepath.write_text(react_content, encoding="utf-8")
-
-    tool_repo = ToolRepository(session)
-    tool = Tool(
-        name="React Tool",
-        description="React Description",
-        tags=["react", "test"],
-        filepath=str(filepath),
-        tool_type=ToolType.REACT,
+    yield from _module_tool(
+        engine,
+        tools_root,
+        "react",
+        react_content,
+        Tool(
+            name="React Tool",
+            description="React Description",
+            tags=["react", "test"],
+            filepath="",
+            tool_type=ToolType.REACT,
+        ),
+    )
+
+
+@pytest.fixture
+def skip_fork_file_write(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip writing the forked tool's HTML file for tests that only check metadata."""
+    monkeypatch.setattr(
+        "html_tool_manager.repositories.tool_repository.atomic_write_file", lambda *args, **kwargs: None
     )
-    return tool_repo.create_tool(tool)
 
 
 class TestForkAPI:
     """Tests for Fork API endpoint."""
 
-    def test_fork_with_custom_name(self, client: TestClient, tool_with_file: Tool):
-        """Test forking a tool with a custom name."""
-        response = client.post(
-            f"/api/tools/{tool_with_file.id}/fork",
-            json={"name": "My Forked Tool"},
-        )
+    @pytest.mark.usefixtures("skip_fork_file_write")
+    @pytest.mark.parametrize(
+        ("body", "expected_name"),
+        [
+            pytest.param({"name": "My Forked Tool"}, "My Forked Tool", id="custom"),
+            pytest.param({"name": ""}, "Original Tool (Fork)", id="empty"),
+            pytest.param({"name": None}, "Original Tool (Fork)", id="null"),
+            pytest.param({}, "Original Tool (Fork)", id="missing"),
+            pytest.param({"name": 'ツール <Test> & "Fork"'}, 'ツール <Test> & "Fork"', id="special-characters"),
+        ],
+    )
+    def test_fork_name_variants(self, client: TestClient, tool_with_file: Tool, body: dict, expected_name: str):
+        """Test the fork name for custom, empty, null, missing and special-character names."""
+        response = client.post(f"/api/tools/{tool_with_file.id}/fork", json=body)
 
         assert response.status_code == 201
         data = response.json()
-        assert data["name"] == "My Forked Tool"
+        assert data["name"] == expected_name
         assert data["description"] == tool_with_file.description
         assert data["tags"] == tool_with_file.tags
         assert data["tool_type"] == tool_with_file.tool_type
         assert data["id"] != tool_with_file.id
 
-    def test_fork_with_empty_name(self, client: TestClient, tool_with_file: Tool):
-        """Test forking with empty name uses default."""
-        response = client.post(
-            f"/api/tools/{tool_with_file.id}/fork",
-            json={"name": ""},
-        )
-
-        assert response.status_code == 201
-        data = response.json()
-        assert data["name"] == "Original Tool (Fork)"
-
-    def test_fork_with_null_name(self, client: TestClient, tool_with_file: Tool):
-        """Test forking with null name uses default."""
-        response = client.post(
-            f"/api/tools/{tool_with_file.id}/fork",
-            json={"name": None},
-        )
-
-        assert response.status_code == 201
-        data = response.json()
-        assert data["name"] == "Original Tool (Fork)"
-
-    def test_fork_without_name_field(self, client: TestClient, tool_with_file: Tool):
-        """Test forking without name field uses default."""
-        response = client.post(
-            f"/api/tools/{tool_with_file.id}/fork",
-            json={},
-        )
-
-        assert response.status_code == 201
-        data = response.json()
-        assert data["name"] == "Original Tool (Fork)"
-
-    def test_fork_nonexistent_tool(self, client: TestClient, session: Session, test_tools_dir: Path):
+    def test_fork_nonexistent_tool(self, client: TestClient):
         """Test forking a non-existent tool returns 404."""
         response = client.post(
             "/api/tools/99999/fork",
@@ -148,11 +153,10 @@ class TestForkAPI:
         # Filepath should be different
         assert forked_tool["filepath"] != tool_with_file.filepath
 
+    @pytest.mark.usefixtures("skip_fork_file_write")
     def test_fork_long_name_truncation(self, client: TestClient, session: Session, test_tools_dir: Path):
         """Test forking a tool with very long name truncates appropriately."""
-        tool_dir = test_tools_dir / f"long-name-{uuid.uuid4()}"
-        tool_dir.mkdir()
-        filepath = tool_dir / "index.html"
+        filepath = test_tools_dir / f"long-name-{uuid.uuid4()}.html"
         filepath.write_text("<html><body>Content</body></html>", encoding="utf-8")
 
         tool_repo = ToolRepository(session)
@@ -186,6 +190,7 @@ class TestForkAPI:
 
         assert response.status_code == 400
 
+    @pytest.mark.usefixtures("skip_fork_file_write")
     def test_fork_preserves_tags(self, client: TestClient, tool_with_file: Tool):
         """Test that forked tool preserves original tags."""
         response = client.post(
@@ -199,6 +204,7 @@ class TestForkAPI:
         # Verify tags are equal but independent
         assert forked_tool["tags"] == tool_with_file.tags
 
+    @pytest.mark.usefixtures("skip_fork_file_write")
     def test_fork_react_tool_preserves_type(self, client: TestClient, react_tool_with_file: Tool):
         """Test forking a React tool preserves the tool_type."""
         response = client.post(
@@ -211,23 +217,10 @@ class TestForkAPI:
         assert data["tool_type"] == "react"
         assert data["name"] == "Forked React Tool"
 
-    def test_fork_with_special_characters_in_name(self, client: TestClient, tool_with_file: Tool):
-        """Test forking with special characters in name."""
-        special_name = 'ツール <Test> & "Fork"'
-        response = client.post(
-            f"/api/tools/{tool_with_file.id}/fork",
-            json={"name": special_name},
-        )
-
-        assert response.status_code == 201
-        data = response.json()
-        assert data["name"] == special_name
-
+    @pytest.mark.usefixtures("skip_fork_file_write")
     def test_fork_tool_with_no_description(self, client: TestClient, session: Session, test_tools_dir: Path):
         """Test forking a tool that has no description."""
-        tool_dir = test_tools_dir / f"no-desc-{uuid.uuid4()}"
-        tool_dir.mkdir()
-        filepath = tool_dir / "index.html"
+        filepath = test_tools_dir / f"no-desc-{uuid.uuid4()}.html"
         filepath.write_text("<html><body>No desc</body></html>", encoding="utf-8")
 
         tool_repo = ToolRepository(session)
@@ -250,9 +243,7 @@ class TestForkAPI:
 
     def test_fork_tool_file_not_found(self, client: TestClient, session: Session, test_tools_dir: Path):
         """Test forking when the tool file has been deleted."""
-        tool_dir = test_tools_dir / f"deleted-{uuid.uuid4()}"
-        tool_dir.mkdir()
-        filepath = tool_dir / "index.html"
+        filepath = test_tools_dir / f"deleted-{uuid.uuid4()}.html"
         filepath.write_text("<html><body>Will be deleted</body></html>", encoding="utf-8")
 
         tool_repo = ToolRepository(session)
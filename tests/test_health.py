@@ -4,18 +4,17 @@ from unittest.mock import MagicMock, patch
 
 from fastapi.testclient import TestClient
 from sqlalchemy.exc import OperationalError
-from sqlmodel import Session
 
 
-def test_health_check_returns_200(session: Session, client: TestClient) -> None:
+def test_health_check_returns_200(client_no_db_reset: TestClient) -> None:
     """Test that health check endpoint returns 200 when healthy."""
-    response = client.get("/health")
+    response = client_no_db_reset.get("/health")
     assert response.status_code == 200
 
 
-def test_health_check_response_structure(session: Session, client: TestClient) -> None:
+def test_health_check_response_structure(client_no_db_reset: TestClient) -> None:
     """Test that health check response has correct structure."""
-    response = client.get("/health")
+    response = client_no_db_reset.get("/health")
     data = response.json()
 
     assert "status" in data
@@ -23,22 +22,22 @@ def test_health_check_response_structure(session: Session, client: TestClient) -
     assert "database" in data["components"]
 
 
-def test_health_check_database_healthy(session: Session, client: TestClient) -> None:
+def test_health_check_database_healthy(client_no_db_reset: TestClient) -> None:
     """Test that database component is healthy."""
-    response = client.get("/health")
+    response = client_no_db_reset.get("/health")
     data = response.json()
 
     assert data["status"] == "healthy"
     assert data["components"]["database"] == "healthy"
 
 
-def test_health_check_database_error_returns_503(session: Session, client: TestClient) -> None:
+def test_health_check_database_error_returns_503(client_no_db_reset: TestClient) -> None:
     """Test that health check returns 503 when database is unhealthy."""
     mock_engine = MagicMock()
     mock_engine.connect.side_effect = OperationalError("Database connection failed", params=None, orig=None)
 
     with patch("html_tool_manager.main.engine", mock_engine):
-        response = client.get("/health")
+        response = client_no_db_reset.get("/health")
 
     assert response.status_code == 503
     data = response.json()
@@ -1,25 +1,38 @@
+from collections.abc import Callable
+from typing import Any
+
 import msgpack
+import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session
 
+# インポートで書き出されるファイルはテスト用ディレクトリに置く
+pytestmark = pytest.mark.usefixtures("test_tools_dir")
 
-def test_export_selected_tools(session: Session, client: TestClient):
-    """Test that only selected tools are exported correctly."""
-    # 1. テストデータを作成 (API経由で)
-    tool1_data = {"name": "Tool 1", "description": "Desc 1", "html_content": "<p>1</p>"}
-    tool2_data = {"name": "Tool 2", "description": "Desc 2", "html_content": "<p>2</p>"}
-    tool3_data = {"name": "Tool 3", "description": "Desc 3", "html_content": "<p>3</p>"}
+# test_import_tools でインポートするデータ（読み取り専用）
+_IMPORT_PAYLOAD_TOOLS = (
+    {"name": "Imported Tool A", "description": "Import A", "tags": ["a"], "html_content": "<h1>A</h1>"},
+    {"name": "Imported Tool B", "description": "Import B", "tags": ["b"], "html_content": "<h1>B</h1>"},
+)
+_IMPORT_PAYLOAD_PACKED = msgpack.packb(list(_IMPORT_PAYLOAD_TOOLS))
 
-    res1 = client.post("/api/tools/", json=tool1_data)
-    res2 = client.post("/api/tools/", json=tool2_data)
-    res3 = client.post("/api/tools/", json=tool3_data)
 
-    assert res1.status_code == 201
-    assert res2.status_code == 201
-    assert res3.status_code == 201
+def _export_roundtrip(client: TestClient, tool_ids: list[int]) -> tuple[bytes, list[dict[str, Any]]]:
+    """Export the given tools and return the raw payload alongside its decoded form."""
+    response = client.post("/api/tools/export", json={"tool_ids": tool_ids})
+    assert response.status_code == 200
+    return response.content, msgpack.unpackb(response.content, raw=False)
+
 
-    tool1_id = res1.json()["id"]
-    tool3_id = res3.json()["id"]
+def test_export_selected_tools(client: TestClient, make_tools: Callable[..., list[int]]):
+    """Test that only selected tools are exported correctly."""
+    # 1. テストデータを作成 (リポジトリを介さず直接投入)
+    tool1_id, _, tool3_id = make_tools(
+        [
+            {"name": "Tool 1", "description": "Desc 1", "html_content": "<p>1</p>"},
+            {"name": "Tool 2", "description": "Desc 2", "html_content": "<p>2</p>"},
+            {"name": "Tool 3", "description": "Desc 3", "html_content": "<p>3</p>"},
+        ]
+    )
 
     # 2. ツール1と3を選択してエクスポートAPIを呼び出す
     response = client.post("/api/tools/export", json={"tool_ids": [tool1_id, tool3_id]})
@@ -44,24 +57,19 @@ def test_export_selected_tools(session: Session, client: TestClient):
     assert tool1_exported["html_content"] == "<p>1</p>"
 
 
-def test_import_tools(session: Session, client: TestClient):
+def test_import_tools(client: TestClient):
     """Test that tools can be imported from an exported file."""
-    # 1. インポートするデータを作成 (MessagePack形式)
-    tools_to_import = [
-        {"name": "Imported Tool A", "description": "Import A", "tags": ["a"], "html_content": "<h1>A</h1>"},
-        {"name": "Imported Tool B", "description": "Import B", "tags": ["b"], "html_content": "<h1>B</h1>"},
-    ]
-    packed_data = msgpack.packb(tools_to_import)
-
-    # 2. インポートAPIを呼び出す
-    response = client.post("/api/tools/import", files={"file": ("tools.pack", packed_data, "application/octet-stream")})
+    # 1. 事前に MessagePack 化したデータでインポートAPIを呼び出す
+    response = client.post(
+        "/api/tools/import", files={"file": ("tools.pack", _IMPORT_PAYLOAD_PACKED, "application/octet-stream")}
+    )
 
-    # 3. レスポンスを検証
+    # 2. レスポンスを検証
     assert response.status_code == 200
     response_data = response.json()
-    assert response_data["imported_count"] == 2
+    assert response_data["imported_count"] == len(_IMPORT_PAYLOAD_TOOLS)
 
-    # 4. ツールが実際にDBに作成されたかを確認
+    # 3. ツールが実際にDBに作成されたかを確認
     all_tools_response = client.get("/api/tools/")
     all_tools = all_tools_response.json()
 
@@ -72,7 +80,7 @@ def test_import_tools(session: Session, client: TestClient):
     assert "Imported Tool B" in db_names
 
 
-def test_react_tool_export_import(session: Session, client: TestClient):
+def test_react_tool_export_import(client: TestClient):
     """React ツールがエクスポート・インポートで tool_type を保持することをテスト。"""
     # React ツールを作成
     jsx_code = "import React from 'react';\nconst App = () => <div>Export Test</div>;"
@@ -88,10 +96,7 @@ def test_react_tool_export_import(session: Session, client: TestClient):
     tool_id = create_response.json()["id"]
 
     # エクスポート
-    export_response = client.post("/api/tools/export", json={"tool_ids": [tool_id]})
-    assert export_response.status_code == 200
-
-    exported_data = msgpack.unpackb(export_response.content, raw=False)
+    packed, exported_data = _export_roundtrip(client, [tool_id])
     assert len(exported_data) == 1
     assert exported_data[0]["tool_type"] == "react"
     assert exported_data[0]["name"] == "Export React Tool"
@@ -102,15 +107,15 @@ def test_react_tool_export_import(session: Session, client: TestClient):
     # インポート
     import_response = client.post(
         "/api/tools/import",
-        files={"file": ("tools.pack", export_response.content, "application/octet-stream")},
+        files={"file": ("tools.pack", packed, "application/octet-stream")},
     )
     assert import_response.status_code == 200
     assert import_response.json()["imported_count"] == 1
 
     # インポートされたツールを確認
     list_response = client.get("/api/tools/")
-    tools = list_response.json()
-    imported_tool = next((t for t in tools if t["name"] == "Export React Tool"), None)
+    tools_by_name = {t["name"]: t for t in list_response.json()}
+    imported_tool = tools_by_name.get("Export React Tool")
 
     assert imported_tool is not None
     assert imported_tool["tool_type"] == "react"
@@ -118,35 +123,28 @@ def test_react_tool_export_import(session: Session, client: TestClient):
     assert set(imported_tool["tags"]) == {"react", "export-test"}
 
 
-def test_mixed_tools_export_import(session: Session, client: TestClient):
+def test_mixed_tools_export_import(client: TestClient, make_tools: Callable[..., list[int]]):
     """HTML と React の混在ツールをエクスポート・インポートできることをテスト。"""
-    # HTML ツールを作成
-    html_data = {
-        "name": "HTML Export Tool",
-        "html_content": "<p>HTML</p>",
-        "tool_type": "html",
-    }
-    html_response = client.post("/api/tools/", json=html_data)
-    html_id = html_response.json()["id"]
-
-    # React ツールを作成
-    jsx_data = {
-        "name": "React Export Tool",
-        "html_content": "import React from 'react';\nconst App = () => <div>React</div>;",
-    }
-    react_response = client.post("/api/tools/", json=jsx_data)
-    react_id = react_response.json()["id"]
+    # HTML ツールと React ツールを作成
+    html_id, react_id = make_tools(
+        [
+            {"name": "HTML Export Tool", "html_content": "<p>HTML</p>", "tool_type": "html"},
+            {
+                "name": "React Export Tool",
+                "html_content": "<!DOCTYPE html><html><body><div id='root'></div></body></html>",
+                "tool_type": "react",
+            },
+        ]
+    )
 
     # 両方をエクスポート
-    export_response = client.post("/api/tools/export", json={"tool_ids": [html_id, react_id]})
-    assert export_response.status_code == 200
-
-    exported_data = msgpack.unpackb(export_response.content, raw=False)
+    packed, exported_data = _export_roundtrip(client, [html_id, react_id])
     assert len(exported_data) == 2
 
     # tool_type が正しく含まれているか確認
-    html_tool = next(t for t in exported_data if t["name"] == "HTML Export Tool")
-    react_tool = next(t for t in exported_data if t["name"] == "React Export Tool")
+    exported_by_name = {t["name"]: t for t in exported_data}
+    html_tool = exported_by_name["HTML Export Tool"]
+    react_tool = exported_by_name["React Export Tool"]
 
     assert html_tool["tool_type"] == "html"
     assert react_tool["tool_type"] == "react"
@@ -158,17 +156,17 @@ def test_mixed_tools_export_import(session: Session, client: TestClient):
     # インポート
     import_response = client.post(
         "/api/tools/import",
-        files={"file": ("tools.pack", export_response.content, "application/octet-stream")},
+        files={"file": ("tools.pack", packed, "application/octet-stream")},
     )
     assert import_response.status_code == 200
     assert import_response.json()["imported_count"] == 2
 
     # インポート後のツールを確認
     list_response = client.get("/api/tools/")
-    tools = list_response.json()
+    tools_by_name = {t["name"]: t for t in list_response.json()}
 
-    html_imported = next((t for t in tools if t["name"] == "HTML Export Tool"), None)
-    react_imported = next((t for t in tools if t["name"] == "React Export Tool"), None)
+    html_imported = tools_by_name.get("HTML Export Tool")
+    react_imported = tools_by_name.get("React Export Tool")
 
     assert html_imported is not None
     assert html_imported["tool_type"] == "html"
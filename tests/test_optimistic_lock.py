@@ -2,10 +2,11 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlmodel import Session, select
 
+from html_tool_manager.api.tools import _create_conflict_error_detail
 from html_tool_manager.core.exceptions import OptimisticLockError
-from html_tool_manager.models import ToolCreate
+from html_tool_manager.models import Tool, ToolCreate
 from html_tool_manager.repositories import ToolRepository
 
 
@@ -72,52 +73,25 @@ class TestOptimisticLockConflict:
         assert detail["current_version"] == 2
         assert detail["your_version"] == 1
 
-    def test_correct_version_succeeds(self, session: Session, client: TestClient, test_tools_dir):
+    def test_correct_version_succeeds(self, session: Session, test_tools_dir):
         """正しいバージョンで更新が成功することをテスト。"""
-        # 作成
-        create_response = client.post("/api/tools/", json={"name": "Test Tool", "html_content": "<p>test</p>"})
-        tool_id = create_response.json()["id"]
-        version = create_response.json()["version"]
+        repo = ToolRepository(session)
+        tool = repo.create_tool_with_content(ToolCreate(name="Test Tool", html_content="<p>test</p>"))
 
-        # 正しいバージョンで更新
-        update_response = client.put(
-            f"/api/tools/{tool_id}",
-            json={
-                "name": "Updated Tool",
-                "html_content": "<p>updated</p>",
-                "version": version,
-            },
-        )
+        # 正しいバージョンで更新（セッションが追跡しているインスタンスとは別の更新データを渡す）
+        updated_tool = repo.update_tool(tool.id, Tool(name="Updated Tool"), expected_version=1)
 
-        assert update_response.status_code == 200
+        assert updated_tool is not None
+        # 条件付き UPDATE の結果を DB から直接読み直して確認する
+        name, version = session.exec(select(Tool.name, Tool.version).where(Tool.id == tool.id)).one()
+        assert name == "Updated Tool"
+        assert version == 2
 
-    def test_conflict_error_message(self, session: Session, client: TestClient, test_tools_dir):
+    def test_conflict_error_message(self):
         """409エラーに適切なメッセージが含まれることをテスト。"""
-        # 作成
-        create_response = client.post("/api/tools/", json={"name": "Test Tool", "html_content": "<p>test</p>"})
-        tool_id = create_response.json()["id"]
-
-        # 先に更新
-        client.put(
-            f"/api/tools/{tool_id}",
-            json={
-                "name": "First Update",
-                "html_content": "<p>first</p>",
-                "version": 1,
-            },
-        )
+        # HTTP 経由の 409 変換は test_conflict_returns_409 で確認済みのため、detail の構築のみ検証
+        detail = _create_conflict_error_detail(current_version=2, your_version=1)
 
-        # 古いバージョンで更新を試みる
-        conflict_response = client.put(
-            f"/api/tools/{tool_id}",
-            json={
-                "name": "Second Update",
-                "html_content": "<p>second</p>",
-                "version": 1,
-            },
-        )
-
-        detail = conflict_response.json()["detail"]
         assert "message" in detail
         assert "他のユーザー" in detail["message"]
 
@@ -160,6 +134,13 @@ class TestOptimisticLockRepository:
         assert updated_tool is not None
         assert updated_tool.version == 2
 
+    def test_repository_returns_none_for_missing_tool(self, session: Session, test_tools_dir):
+        """存在しないツールの更新では例外ではなく None を返すことをテスト。"""
+        repo = ToolRepository(session)
+        tool = repo.create_tool_with_content(ToolCreate(name="Test", html_content="<p>test</p>"))
+
+        assert repo.update_tool(tool.id + 1000, tool, expected_version=1) is None
+
 
 class TestVersionRequirement:
     """versionフィールド必須のテスト。"""
@@ -1,29 +1,16 @@
 """Edge case tests for React tool management."""
 
+from pathlib import Path
+
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
+# 作成したツールはテストごとのロールバックと一時ディレクトリで片付くため、個別の削除は不要
+pytestmark = pytest.mark.usefixtures("test_tools_dir")
 
-def test_ambiguous_code_defaults_to_html(client: TestClient, session: Session):
-    """曖昧なコード（React パターンが 1 つ以下）は HTML として扱われることをテスト。"""
-    ambiguous_code = "<div>Hello</div>"
-    tool_data = {
-        "name": "Ambiguous Tool",
-        "html_content": ambiguous_code,
-    }
-
-    response = client.post("/api/tools/", json=tool_data)
-    assert response.status_code == 201
-    data = response.json()
-    assert data["tool_type"] == "html"
-
-    # クリーンアップ
-    client.delete(f"/api/tools/{data['id']}")
-
-
-def test_complex_jsx_with_multiple_components(client: TestClient, session: Session):
-    """複数のコンポーネントを含む複雑な JSX が正しく処理されることをテスト。"""
-    jsx_code = """
+# テストで投稿する JSX コード
+_JSX_COMPLEX = """
 import React, { useState, useEffect } from 'react';
 
 const Header = () => <h1>Header</h1>;
@@ -46,9 +33,77 @@ function App() {
     );
 }
 """
+
+_JSX_STYLED = """
+import React from 'react';
+
+const App = () => {
+    const style = {
+        color: 'blue',
+        fontSize: '16px'
+    };
+
+    return <div style={style}>Styled Text</div>;
+};
+"""
+
+_JSX_FRAGMENTS = """
+import React from 'react';
+
+const App = () => {
+    return (
+        <>
+            <h1>Title</h1>
+            <p>Paragraph</p>
+        </>
+    );
+};
+"""
+
+_JSX_EVENTS = """
+import React, { useState } from 'react';
+
+const App = () => {
+    const [count, setCount] = useState(0);
+
+    const handleClick = () => {
+        setCount(count + 1);
+    };
+
+    const handleDoubleClick = () => {
+        setCount(count * 2);
+    };
+
+    return (
+        <div>
+            <button onClick={handleClick}>Click</button>
+            <button onDoubleClick={handleDoubleClick}>Double Click</button>
+            <p>{count}</p>
+        </div>
+    );
+};
+"""
+
+
+def test_ambiguous_code_defaults_to_html(client: TestClient, session: Session):
+    """曖昧なコード（React パターンが 1 つ以下）は HTML として扱われることをテスト。"""
+    ambiguous_code = "<div>Hello</div>"
+    tool_data = {
+        "name": "Ambiguous Tool",
+        "html_content": ambiguous_code,
+    }
+
+    response = client.post("/api/tools/", json=tool_data)
+    assert response.status_code == 201
+    data = response.json()
+    assert data["tool_type"] == "html"
+
+
+def test_complex_jsx_with_multiple_components(client: TestClient, session: Session):
+    """複数のコンポーネントを含む複雑な JSX が正しく処理されることをテスト。"""
     tool_data = {
         "name": "Complex Component",
-        "html_content": jsx_code,
+        "html_content": _JSX_COMPLEX,
     }
 
     response = client.post("/api/tools/", json=tool_data)
@@ -57,36 +112,20 @@ function App() {
     assert data["tool_type"] == "react"
 
     # ファイル内容を確認
-    with open(data["filepath"]) as f:
-        content = f.read()
-        # import 文が削除されている
-        assert "import React" not in content
-        # 全てのコンポーネントが保持されている
-        assert "const Header" in content
-        assert "const Footer" in content
-        assert "function App" in content
-
-    # クリーンアップ
-    client.delete(f"/api/tools/{data['id']}")
+    content = Path(data["filepath"]).read_text(encoding="utf-8")
+    # import 文が削除されている
+    assert "import React" not in content
+    # 全てのコンポーネントが保持されている
+    assert "const Header" in content
+    assert "const Footer" in content
+    assert "function App" in content
 
 
 def test_jsx_with_inline_styles(client: TestClient, session: Session):
     """インラインスタイルを含む JSX が正しく処理されることをテスト。"""
-    jsx_code = """
-import React from 'react';
-
-const App = () => {
-    const style = {
-        color: 'blue',
-        fontSize: '16px'
-    };
-
-    return <div style={style}>Styled Text</div>;
-};
-"""
     tool_data = {
         "name": "Styled Component",
-        "html_content": jsx_code,
+        "html_content": _JSX_STYLED,
     }
 
     response = client.post("/api/tools/", json=tool_data)
@@ -95,13 +134,9 @@ const App = () => {
     assert data["tool_type"] == "react"
 
     # ファイル内容を確認
-    with open(data["filepath"]) as f:
-        content = f.read()
-        assert "const style" in content
-        assert "fontSize" in content
-
-    # クリーンアップ
-    client.delete(f"/api/tools/{data['id']}")
+    content = Path(data["filepath"]).read_text(encoding="utf-8")
+    assert "const style" in content
+    assert "fontSize" in content
 
 
 def test_create_tool_with_empty_html_content(client: TestClient, session: Session):
@@ -117,7 +152,6 @@ def test_create_tool_with_empty_html_content(client: TestClient, session: Sessio
         data = response.json()
         # デフォルトで HTML として扱われる
         assert data["tool_type"] == "html"
-        client.delete(f"/api/tools/{data['id']}")
 
 
 def test_update_tool_without_changing_type(client: TestClient, session: Session):
@@ -145,27 +179,12 @@ def test_update_tool_without_changing_type(client: TestClient, session: Session)
     assert updated_tool["tool_type"] == "react"
     assert updated_tool["description"] == "Updated description"
 
-    # クリーンアップ
-    client.delete(f"/api/tools/{tool_id}")
-
 
 def test_jsx_with_fragments(client: TestClient, session: Session):
     """React Fragment を使用した JSX が正しく処理されることをテスト。"""
-    jsx_code = """
-import React from 'react';
-
-const App = () => {
-    return (
-        <>
-            <h1>Title</h1>
-            <p>Paragraph</p>
-        </>
-    );
-};
-"""
     tool_data = {
         "name": "Fragment Test",
-        "html_content": jsx_code,
+        "html_content": _JSX_FRAGMENTS,
     }
 
     response = client.post("/api/tools/", json=tool_data)
@@ -174,43 +193,16 @@ const App = () => {
     assert data["tool_type"] == "react"
 
     # ファイル内容を確認
-    with open(data["filepath"]) as f:
-        content = f.read()
-        # Fragment の構文が保持されている
-        assert "<>" in content or "React.Fragment" in content
-
-    # クリーンアップ
-    client.delete(f"/api/tools/{data['id']}")
+    content = Path(data["filepath"]).read_text(encoding="utf-8")
+    # Fragment の構文が保持されている
+    assert "<>" in content or "React.Fragment" in content
 
 
 def test_jsx_with_event_handlers(client: TestClient, session: Session):
     """イベントハンドラを含む JSX が正しく処理されることをテスト。"""
-    jsx_code = """
-import React, { useState } from 'react';
-
-const App = () => {
-    const [count, setCount] = useState(0);
-
-    const handleClick = () => {
-        setCount(count + 1);
-    };
-
-    const handleDoubleClick = () => {
-        setCount(count * 2);
-    };
-
-    return (
-        <div>
-            <button onClick={handleClick}>Click</button>
-            <button onDoubleClick={handleDoubleClick}>Double Click</button>
-            <p>{count}</p>
-        </div>
-    );
-};
-"""
     tool_data = {
         "name": "Event Handler Test",
-        "html_content": jsx_code,
+        "html_content": _JSX_EVENTS,
     }
 
     response = client.post("/api/tools/", json=tool_data)
@@ -219,15 +211,11 @@ const App = () => {
     assert data["tool_type"] == "react"
 
     # ファイル内容を確認
-    with open(data["filepath"]) as f:
-        content = f.read()
-        assert "handleClick" in content
-        assert "handleDoubleClick" in content
-        assert "onClick" in content
-        assert "onDoubleClick" in content
-
-    # クリーンアップ
-    client.delete(f"/api/tools/{data['id']}")
+    content = Path(data["filepath"]).read_text(encoding="utf-8")
+    assert "handleClick" in content
+    assert "handleDoubleClick" in content
+    assert "onClick" in content
+    assert "onDoubleClick" in content
 
 
 def test_backward_compatibility_existing_html_tools(client: TestClient, session: Session):
@@ -248,9 +236,6 @@ def test_backward_compatibility_existing_html_tools(client: TestClient, session:
     # 後方互換性: HTML として検出される
     assert data["tool_type"] == "html"
 
-    # クリーンアップ
-    client.delete(f"/api/tools/{data['id']}")
-
 
 def test_updated_at_changes_on_update(client: TestClient, session: Session):
     """ツール更新時にupdated_atが更新されることをテスト。"""
@@ -284,6 +269,3 @@ def test_updated_at_changes_on_update(client: TestClient, session: Session):
     # updated_atが変更されていることを確認
     assert updated_data["updated_at"] != original_updated_at
     assert updated_data["updated_at"] > original_updated_at
-
-    # クリーンアップ
-    client.delete(f"/api/tools/{tool_id}")
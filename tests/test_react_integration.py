@@ -1,10 +1,15 @@
 """Integration tests for React tool management."""
 
 import os
+from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
+# 作成したツールはテストごとのロールバックと一時ディレクトリで片付くため、個別の削除は不要
+pytestmark = pytest.mark.usefixtures("test_tools_dir")
+
 
 def test_create_react_tool_auto_detection(client: TestClient, session: Session):
     """React コードが自動検出され、React ツールとして作成されることをテスト。"""
@@ -39,18 +44,14 @@ function App() {
     assert os.path.exists(data["filepath"])
 
     # ファイル内容を確認
-    with open(data["filepath"]) as f:
-        content = f.read()
-        assert "<!DOCTYPE html>" in content
-        assert "react@18.2.0" in content
-        assert "@babel/standalone@7.23.5" in content
-        # 元の JSX コードは変換されている
-        assert "function App" in content
-        # import 文は削除されている
-        assert "import React" not in content
-
-    # クリーンアップ
-    client.delete(f"/api/tools/{data['id']}")
+    content = Path(data["filepath"]).read_text(encoding="utf-8")
+    assert "<!DOCTYPE html>" in content
+    assert "react@18.2.0" in content
+    assert "@babel/standalone@7.23.5" in content
+    # 元の JSX コードは変換されている
+    assert "function App" in content
+    # import 文は削除されている
+    assert "import React" not in content
 
 
 def test_create_react_tool_explicit_type(client: TestClient, session: Session):
@@ -69,13 +70,9 @@ def test_create_react_tool_explicit_type(client: TestClient, session: Session):
     assert data["tool_type"] == "react"
 
     # ファイル内容を確認
-    with open(data["filepath"]) as f:
-        content = f.read()
-        assert "react@18.2.0" in content
-        assert "const App" in content
-
-    # クリーンアップ
-    client.delete(f"/api/tools/{data['id']}")
+    content = Path(data["filepath"]).read_text(encoding="utf-8")
+    assert "react@18.2.0" in content
+    assert "const App" in content
 
 
 def test_create_html_tool_with_html_content(client: TestClient, session: Session):
@@ -96,9 +93,6 @@ def test_create_html_tool_with_html_content(client: TestClient, session: Session
     data = response.json()
     assert data["tool_type"] == "html"
 
-    # クリーンアップ
-    client.delete(f"/api/tools/{data['id']}")
-
 
 def test_react_tool_appears_in_list(client: TestClient, session: Session):
     """React ツールが一覧に表示されることをテスト。"""
@@ -127,9 +121,6 @@ function App() { return <div>Test</div>; }
     assert react_tool["tool_type"] == "react"
     assert react_tool["name"] == "List Test React Tool"
 
-    # クリーンアップ
-    client.delete(f"/api/tools/{tool_id}")
-
 
 def test_update_tool_type_html_to_react(client: TestClient, session: Session):
     """ツールタイプを HTML から React に変更できることをテスト。"""
@@ -163,15 +154,11 @@ const App = () => <div>Updated to React</div>;
     assert updated_tool["tool_type"] == "react"
 
     # ファイルが React テンプレートでラップされているか確認
-    with open(updated_tool["filepath"]) as f:
-        content = f.read()
-        assert "react@18.2.0" in content
-        assert "<!DOCTYPE html>" in content
-        # import 文は削除されている
-        assert "import React" not in content
-
-    # クリーンアップ
-    client.delete(f"/api/tools/{tool_id}")
+    content = Path(updated_tool["filepath"]).read_text(encoding="utf-8")
+    assert "react@18.2.0" in content
+    assert "<!DOCTYPE html>" in content
+    # import 文は削除されている
+    assert "import React" not in content
 
 
 def test_mixed_tools_list(client: TestClient, session: Session):
@@ -198,7 +185,3 @@ def test_mixed_tools_list(client: TestClient, session: Session):
 
     assert html_tool["tool_type"] == "html"
     assert react_tool["tool_type"] == "react"
-
-    # クリーンアップ
-    client.delete(f"/api/tools/{html_id}")
-    client.delete(f"/api/tools/{react_id}")
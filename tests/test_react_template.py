@@ -1,19 +1,27 @@
 """Tests for React template generation."""
 
+import pytest
+
 from html_tool_manager.templates.react_template import (
     _transform_imports_exports,
     generate_react_html,
 )
 
 
-def test_generate_react_html_basic():
-    """基本的な React HTML 生成のテスト。"""
+@pytest.fixture(scope="module")
+def baseline_react_html() -> str:
+    """Generate the React HTML for a basic component once per module."""
     jsx_code = """
 function App() {
     return <div>Hello React!</div>;
 }
 """
-    result = generate_react_html(jsx_code)
+    return generate_react_html(jsx_code)
+
+
+def test_generate_react_html_basic(baseline_react_html: str):
+    """基本的な React HTML 生成のテスト。"""
+    result = baseline_react_html
 
     assert "<!DOCTYPE html>" in result
     assert "react@18.2.0" in result
@@ -120,10 +128,9 @@ export default MyComponent;
     assert "function MyComponent" in result
 
 
-def test_react18_hooks_included_in_template():
+def test_react18_hooks_included_in_template(baseline_react_html: str):
     """React 18 の hooks がテンプレートに含まれることをテスト。"""
-    jsx_code = "function App() { return <div>Test</div>; }"
-    result = generate_react_html(jsx_code)
+    result = baseline_react_html
 
     # 基本 hooks
     assert "useState" in result
@@ -181,3 +188,11 @@ function App() {
     # 両方エスケープされていること
     assert r"<\/script>" in result
     assert r"<\/SCRIPT>" in result
+
+
+def test_script_tag_mixed_case_escape():
+    """大文字小文字が混在した</Script>タグもエスケープされることをテスト。"""
+    result = generate_react_html("function App() { const a = '</Script>'; return <div>Test</div>; }")
+
+    assert r"<\/Script>" in result
+    assert "</Script>" not in result
@@ -1,21 +1,16 @@
+from collections.abc import Callable
+
 from fastapi.testclient import TestClient
-from sqlmodel import Session
 
 
-def test_search_by_name_prefix(session: Session, client: TestClient):
+def test_search_by_name_prefix(client: TestClient, make_tools: Callable[..., list[int]]):
     """Test searching tools by name prefix."""
-    # 1. Create test data via API
+    # 1. Create test data directly through the session
     tool1_data = {"name": "json formatter", "description": "Formats JSON.", "html_content": "<p>json</p>"}
     tool2_data = {"name": "jwt decoder", "description": "Decodes JWT.", "html_content": "<p>jwt</p>"}
     tool3_data = {"name": "text counter", "description": "Counts text characters.", "html_content": "<p>text</p>"}
 
-    res1 = client.post("/api/tools/", json=tool1_data)
-    res2 = client.post("/api/tools/", json=tool2_data)
-    res3 = client.post("/api/tools/", json=tool3_data)
-
-    assert res1.status_code == 201
-    assert res2.status_code == 201
-    assert res3.status_code == 201
+    make_tools([tool1_data, tool2_data, tool3_data])
 
     # 2. Perform search
     response = client.get("/api/tools/?q=name:j")
@@ -31,9 +26,9 @@ def test_search_by_name_prefix(session: Session, client: TestClient):
     assert "text counter" not in found_names
 
 
-def test_search_by_tag(session: Session, client: TestClient):
+def test_search_by_tag(client: TestClient, make_tools: Callable[..., list[int]]):
     """Test searching tools by tag."""
-    # 1. Create test data via API
+    # 1. Create test data directly through the session
     tool1_data = {
         "name": "json formatter",
         "description": "Formats JSON.",
@@ -53,13 +48,7 @@ def test_search_by_tag(session: Session, client: TestClient):
         "tags": ["text", "counter", "util"],
     }
 
-    res1 = client.post("/api/tools/", json=tool1_data)
-    res2 = client.post("/api/tools/", json=tool2_data)
-    res3 = client.post("/api/tools/", json=tool3_data)
-
-    assert res1.status_code == 201
-    assert res2.status_code == 201
-    assert res3.status_code == 201
+    make_tools([tool1_data, tool2_data, tool3_data])
 
     # 2. Perform search for partial tag match
     response = client.get("/api/tools/?q=tag:ut")
@@ -73,20 +62,14 @@ def test_search_by_tag(session: Session, client: TestClient):
     assert "text counter" in found_names
 
 
-def test_search_with_phrase(session: Session, client: TestClient):
+def test_search_with_phrase(client: TestClient, make_tools: Callable[..., list[int]]):
     """Test searching tools with a phrase query."""
-    # 1. Create test data via API
+    # 1. Create test data directly through the session
     tool1_data = {"name": "My Awesome Tool", "description": "Something awesome.", "html_content": "<p>awesome</p>"}
     tool2_data = {"name": "My Other Tool", "description": "Something else.", "html_content": "<p>else</p>"}
     tool3_data = {"name": "Another Tool", "description": "This is an Awesome Tool.", "html_content": "<p>another</p>"}
 
-    res1 = client.post("/api/tools/", json=tool1_data)
-    res2 = client.post("/api/tools/", json=tool2_data)
-    res3 = client.post("/api/tools/", json=tool3_data)
-
-    assert res1.status_code == 201
-    assert res2.status_code == 201
-    assert res3.status_code == 201
+    make_tools([tool1_data, tool2_data, tool3_data])
 
     # 2. Perform search
     response = client.get('/api/tools/?q=name:"Awesome Tool"')
@@ -96,3 +79,41 @@ def test_search_with_phrase(session: Session, client: TestClient):
     # 3. Assert results
     assert len(data) == 1
     assert data[0]["name"] == "My Awesome Tool"
+
+
+def test_search_by_tag_substring_uses_trigram_index(client: TestClient, make_tools: Callable[..., list[int]]):
+    """Test that tag substrings of three or more characters match through the trigram index."""
+    _, clock_id = make_tools(
+        [
+            {"name": "color picker", "html_content": "<p>1</p>", "tags": ["utility"]},
+            {"name": "clock", "html_content": "<p>2</p>", "tags": ["time"]},
+        ]
+    )
+
+    response = client.get("/api/tools/?q=tag:TIL")
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()] == ["color picker"]
+
+    # タグ更新後は新しいタグで検索できること（トリガーで索引が更新される）
+    update = client.put(f"/api/tools/{clock_id}", json={"name": "clock", "tags": ["utilities"], "version": 1})
+    assert update.status_code == 200
+
+    response = client.get("/api/tools/?q=tag:util")
+    assert {item["name"] for item in response.json()} == {"color picker", "clock"}
+    response = client.get("/api/tools/?q=tag:time")
+    assert response.json() == []
+
+
+def test_search_by_short_tag_with_double_quote_uses_like(client: TestClient, make_tools: Callable[..., list[int]]):
+    """Test that a double quote does not count twice toward the trigram length threshold."""
+    make_tools(
+        [
+            {"name": "csv viewer", "html_content": "<p>1</p>", "tags": ["data"]},
+            {"name": "clock", "html_content": "<p>2</p>", "tags": ["time"]},
+        ]
+    )
+
+    # tags は JSON 文字列として検索されるため、'a"' は "data" の末尾に一致する
+    response = client.get("/api/tools/", params={"q": 'tag:a"'})
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()] == ["csv viewer"]
@@ -1,12 +1,25 @@
 """Security tests for the HTML Tool Manager."""
 
 import os
+import uuid
 
 import pytest
+from fastapi.testclient import TestClient
+from httpx import Response
 
 from html_tool_manager.core.security import is_path_within_base
+from html_tool_manager.models import Tool
+from html_tool_manager.repositories import ToolRepository
 from html_tool_manager.repositories.tool_repository import _escape_fts5_term
 
+# These should not cause SQL injection
+_DANGEROUS_FTS5_INPUTS = (
+    'name:" OR 1=1 --',
+    "'; DROP TABLE tool; --",
+    "test\x00null",  # null byte
+    "query*wildcard",
+)
+
 
 class TestIsPathWithinBase:
     """Tests for is_path_within_base function (cross-platform path traversal detection)."""
@@ -55,6 +68,25 @@ class TestIsPathWithinBase:
 
         assert is_path_within_base(str(symlink), str(base)) is False
 
+    def test_repointed_base_symlink_uses_new_target(self, tmp_path):
+        """Test a base directory symlink is re-resolved after it is repointed."""
+        old_release = tmp_path / "old"
+        old_release.mkdir()
+        new_release = tmp_path / "new"
+        new_release.mkdir()
+        base = tmp_path / "tools"
+        base.symlink_to(old_release)
+        old_file = old_release / "file.txt"
+        old_file.touch()
+        assert is_path_within_base(str(old_file), str(base)) is True
+
+        # デプロイ時の切り替えのように、基準ディレクトリのリンク先を差し替える
+        base.unlink()
+        base.symlink_to(new_release)
+
+        assert is_path_within_base(str(old_file), str(base)) is False
+        assert is_path_within_base(str(new_release / "file.txt"), str(base)) is True
+
     def test_base_path_itself_returns_true(self, tmp_path):
         """Test that base path itself is considered within base."""
         base = tmp_path / "base"
@@ -119,19 +151,12 @@ class TestFTS5Injection:
         assert '""' in result  # Double quotes should be escaped
         assert result == '"test""query"*'
 
-    def test_fts5_escapes_special_characters(self):
+    @pytest.mark.parametrize("term", _DANGEROUS_FTS5_INPUTS)
+    def test_fts5_escapes_special_characters(self, term):
         """Test FTS5 handles special characters safely."""
-        # These should not cause SQL injection
-        dangerous_inputs = [
-            'name:" OR 1=1 --',
-            "'; DROP TABLE tool; --",
-            "test\x00null",  # null byte
-            "query*wildcard",
-        ]
-        for term in dangerous_inputs:
-            result = _escape_fts5_term(term)
-            # Should return a safely escaped string or empty
-            assert isinstance(result, str)
+        result = _escape_fts5_term(term)
+        # Should return a safely escaped string or empty
+        assert isinstance(result, str)
 
     def test_fts5_handles_null_bytes(self):
         """Test null bytes are filtered from search queries."""
@@ -184,6 +209,7 @@ class TestIncompleteFieldPrefix:
         assert response.status_code == 200
 
 
+@pytest.mark.usefixtures("test_tools_dir")
 class TestFilepathValidation:
     """Tests for filepath validation (directory traversal prevention)."""
 
@@ -252,29 +278,48 @@ class TestFilepathValidation:
             assert updated_tool["filepath"] == original_filepath
             assert "../" not in updated_tool["filepath"]
 
-        # Cleanup
-        client.delete(f"/api/tools/{tool['id']}")
 
+class TestDeleteToolFiles:
+    """Tests for file cleanup when a tool is deleted."""
 
-class TestSecurityHeaders:
-    """Tests for security headers."""
+    def test_delete_file_directly_in_tools_dir_keeps_tools_dir(self, session, test_tools_dir):
+        """Test deleting a tool whose file has no own directory removes only that file."""
+        filepath = test_tools_dir / f"{uuid.uuid4()}.html"
+        filepath.write_text("<p>test</p>", encoding="utf-8")
+        other = test_tools_dir / f"{uuid.uuid4()}.html"
+        other.write_text("<p>other</p>", encoding="utf-8")
+        repo = ToolRepository(session)
+        tool = repo.create_tool(Tool(name="Flat File Tool", filepath=str(filepath)))
+
+        repo.delete_tool(tool.id)
+
+        assert not filepath.exists()
+        assert other.exists()
 
-    def test_x_frame_options_header(self, client):
-        """Test X-Frame-Options header is set."""
-        response = client.get("/")
-        assert response.headers.get("X-Frame-Options") == "SAMEORIGIN"
 
-    def test_x_content_type_options_header(self, client):
-        """Test X-Content-Type-Options header is set."""
-        response = client.get("/")
-        assert response.headers.get("X-Content-Type-Options") == "nosniff"
+@pytest.fixture(scope="module")
+def root_response(shared_client: TestClient) -> Response:
+    """Fetch the home page once for all security header checks."""
+    return shared_client.get("/")
 
-    def test_referrer_policy_header(self, client):
-        """Test Referrer-Policy header is set."""
-        response = client.get("/")
-        assert response.headers.get("Referrer-Policy") == "strict-origin-when-cross-origin"
 
+class TestSecurityHeaders:
+    """Tests for security headers."""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("X-Frame-Options", "SAMEORIGIN"),
+            ("X-Content-Type-Options", "nosniff"),
+            ("Referrer-Policy", "strict-origin-when-cross-origin"),
+        ],
+    )
+    def test_security_header(self, root_response: Response, header: str, expected: str):
+        """Test each security header is set on the home page."""
+        assert root_response.headers.get(header) == expected
 
+
+@pytest.mark.usefixtures("test_tools_dir")
 class TestXSSPrevention:
     """Tests for XSS prevention."""
 
@@ -300,9 +345,6 @@ class TestXSSPrevention:
         assert get_response.status_code == 200
         assert get_response.json()["name"] == "<script>alert('xss')</script>"
 
-        # Cleanup
-        client.delete(f"/api/tools/{tool['id']}")
-
     def test_description_with_script_tag(self, client):
         """Test description with script tag is stored safely."""
         response = client.post(
@@ -317,6 +359,3 @@ class TestXSSPrevention:
         assert response.status_code == 201
         tool = response.json()
         assert "<script>" in tool["description"]
-
-        # Cleanup
-        client.delete(f"/api/tools/{tool['id']}")
@@ -1,6 +1,7 @@
 """Tests for Snapshot API endpoints."""
 
-import os
+import uuid
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
@@ -9,41 +10,29 @@ from sqlmodel import Session
 from html_tool_manager.models import Tool
 from html_tool_manager.repositories import SnapshotRepository, ToolRepository
 
+_INITIAL_CONTENT = "<html><body>Initial content</body></html>"
+_MODIFIED_CONTENT = "<html><body>Modified content</body></html>"
+
 
 @pytest.fixture
-def tool_with_file(session: Session) -> Tool:
+def tool_with_file(session: Session, test_tools_dir: Path) -> Tool:
     """Create a test tool with an actual file."""
-    # Ensure static/tools directory exists
-    os.makedirs("static/tools", exist_ok=True)
-
-    # Create a temporary directory for the tool with a unique name
-    import uuid
-
-    tool_dir = f"static/tools/test-{uuid.uuid4()}"
-    os.makedirs(tool_dir, exist_ok=True)
-    filepath = os.path.join(tool_dir, "index.html")
+    # Create a directory for the tool with a unique name
+    tool_dir = test_tools_dir / f"test-{uuid.uuid4()}"
+    tool_dir.mkdir()
+    filepath = tool_dir / "index.html"
 
     # Write initial content
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write("<html><body>Initial content</body></html>")
+    filepath.write_text(_INITIAL_CONTENT, encoding="utf-8")
 
     tool_repo = ToolRepository(session)
     tool = Tool(
         name="Test Tool",
         description="Test Description",
         tags=["test"],
-        filepath=filepath,
+        filepath=str(filepath),
     )
-    created_tool = tool_repo.create_tool(tool)
-
-    yield created_tool
-
-    # Cleanup
-    try:
-        os.remove(filepath)
-        os.rmdir(tool_dir)
-    except OSError:
-        pass
+    return tool_repo.create_tool(tool)
 
 
 class TestSnapshotAPI:
@@ -106,7 +95,7 @@ class TestSnapshotAPI:
         assert data["id"] == snapshot_id
         assert data["name"] == "Test Snapshot"
         assert "html_content" in data
-        assert "Initial content" in data["html_content"]
+        assert data["html_content"] == _INITIAL_CONTENT
 
     def test_get_snapshot_not_found(self, client: TestClient, tool_with_file: Tool):
         """Test getting a non-existent snapshot."""
@@ -142,8 +131,7 @@ class TestSnapshotAPI:
         snapshot_id = create_response.json()["id"]
 
         # Modify the file
-        with open(tool_with_file.filepath, "w", encoding="utf-8") as f:
-            f.write("<html><body>Modified content</body></html>")
+        Path(tool_with_file.filepath).write_text(_MODIFIED_CONTENT, encoding="utf-8")
 
         # Restore
         response = client.post(f"/api/tools/{tool_with_file.id}/snapshots/{snapshot_id}/restore")
@@ -151,9 +139,8 @@ class TestSnapshotAPI:
         assert response.status_code == 200
 
         # Verify file content is restored
-        with open(tool_with_file.filepath, encoding="utf-8") as f:
-            content = f.read()
-        assert "Initial content" in content
+        content = Path(tool_with_file.filepath).read_text(encoding="utf-8")
+        assert content == _INITIAL_CONTENT
 
     def test_get_diff(self, client: TestClient, tool_with_file: Tool, session: Session):
         """Test getting diff between snapshot and current content."""
@@ -165,17 +152,61 @@ class TestSnapshotAPI:
         snapshot_id = create_response.json()["id"]
 
         # Modify the file
-        with open(tool_with_file.filepath, "w", encoding="utf-8") as f:
-            f.write("<html><body>New content</body></html>")
+        Path(tool_with_file.filepath).write_text(_MODIFIED_CONTENT, encoding="utf-8")
 
         response = client.get(f"/api/tools/{tool_with_file.id}/snapshots/{snapshot_id}/diff")
 
         assert response.status_code == 200
         data = response.json()
         assert data["old_snapshot_id"] == snapshot_id
-        assert "Initial content" in data["old_content"]
-        assert "New content" in data["new_content"]
         assert data["new_snapshot_id"] is None  # Comparing to current
+        assert data["equal"] is False
+        diff_lines = data["diff"].splitlines()
+        assert f"-{_INITIAL_CONTENT}" in diff_lines
+        assert f"+{_MODIFIED_CONTENT}" in diff_lines
+
+    def test_get_diff_equal_content(self, client: TestClient, tool_with_file: Tool):
+        """Test that an unchanged tool yields an empty diff."""
+        create_response = client.post(
+            f"/api/tools/{tool_with_file.id}/snapshots",
+            json={"name": "Snapshot", "snapshot_type": "manual"},
+        )
+        snapshot_id = create_response.json()["id"]
+
+        response = client.get(f"/api/tools/{tool_with_file.id}/snapshots/{snapshot_id}/diff")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["equal"] is True
+        assert data["diff"] == ""
+
+    @pytest.mark.parametrize(
+        ("old_content", "new_content"),
+        [
+            ("a\nb", "a\nb\n"),
+            ("a\r\nb\r\n", "a\nb\n"),
+        ],
+        ids=["trailing-newline", "crlf-to-lf"],
+    )
+    def test_get_diff_newline_only_change(
+        self, client: TestClient, tool_with_file: Tool, session: Session, old_content: str, new_content: str
+    ):
+        """Test that changes to line endings alone still produce diff hunks."""
+        # ファイル経由の読み込みは改行を正規化するため、スナップショット同士を比較する
+        old_snapshot, new_snapshot = SnapshotRepository(session).create_snapshots_bulk(
+            tool_with_file.id, [old_content, new_content]
+        )
+
+        response = client.get(
+            f"/api/tools/{tool_with_file.id}/snapshots/{old_snapshot.id}/diff",
+            params={"compare_to": new_snapshot.id},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["equal"] is False
+        assert "@@" in data["diff"]
+        assert "-b" in data["diff"].splitlines()
 
     def test_tool_not_found(self, client: TestClient):
         """Test that snapshot endpoints return 404 for non-existent tool."""
@@ -192,7 +223,7 @@ class TestSnapshotAPI:
                 "description": tool_with_file.description,
                 "tags": tool_with_file.tags,
                 "filepath": tool_with_file.filepath,
-                "html_content": "<html><body>Updated content</body></html>",
+                "html_content": _MODIFIED_CONTENT,
                 "version": tool_with_file.version,
             },
         )
@@ -208,11 +239,7 @@ class TestSnapshotAPI:
 
     def test_no_snapshot_on_same_content(self, client: TestClient, tool_with_file: Tool):
         """Test that no snapshot is created when content is unchanged."""
-        # Read current content
-        with open(tool_with_file.filepath, encoding="utf-8") as f:
-            current_content = f.read()
-
-        # Update with same content
+        # Update with the content written by the fixture
         response = client.put(
             f"/api/tools/{tool_with_file.id}",
             json={
@@ -220,7 +247,7 @@ class TestSnapshotAPI:
                 "description": tool_with_file.description,
                 "tags": tool_with_file.tags,
                 "filepath": tool_with_file.filepath,
-                "html_content": current_content,
+                "html_content": _INITIAL_CONTENT,
                 "version": tool_with_file.version,
             },
         )
@@ -236,14 +263,10 @@ class TestSnapshotAPI:
     def test_delete_tool_deletes_snapshots(self, client: TestClient, tool_with_file: Tool, session: Session):
         """Test that deleting a tool also deletes its snapshots."""
         # Create some snapshots
-        for i in range(3):
-            client.post(
-                f"/api/tools/{tool_with_file.id}/snapshots",
-                json={"name": f"Snapshot {i}", "snapshot_type": "manual"},
-            )
+        repo = SnapshotRepository(session)
+        repo.create_snapshots_bulk(tool_with_file.id, [f"<html>version {i}</html>" for i in range(3)])
 
         # Verify snapshots exist
-        repo = SnapshotRepository(session)
         assert repo.count_snapshots(tool_with_file.id) == 3
 
         # Delete the tool
@@ -1,10 +1,13 @@
 """Tests for SnapshotRepository."""
 
+from datetime import datetime, timezone
+
 import pytest
+from sqlalchemy import insert
 from sqlmodel import Session
 
 from html_tool_manager.models import Tool
-from html_tool_manager.models.snapshot import MAX_SNAPSHOTS_PER_TOOL, SnapshotType
+from html_tool_manager.models.snapshot import MAX_CONTENT_SIZE_BYTES, MAX_SNAPSHOTS_PER_TOOL, SnapshotType, ToolSnapshot
 from html_tool_manager.repositories import SnapshotRepository, ToolRepository
 
 
@@ -57,11 +60,7 @@ class TestSnapshotRepository:
         repo = SnapshotRepository(session)
 
         # Create multiple snapshots
-        for i in range(3):
-            repo.create_snapshot(
-                tool_id=tool.id,
-                html_content=f"<html>version {i}</html>",
-            )
+        repo.create_snapshots_bulk(tool.id, [f"<html>version {i}</html>" for i in range(3)])
 
         snapshots = repo.get_snapshots_by_tool(tool.id)
 
@@ -118,11 +117,7 @@ class TestSnapshotRepository:
         repo = SnapshotRepository(session)
 
         # Create multiple snapshots
-        for i in range(5):
-            repo.create_snapshot(
-                tool_id=tool.id,
-                html_content=f"<html>version {i}</html>",
-            )
+        repo.create_snapshots_bulk(tool.id, [f"<html>version {i}</html>" for i in range(5)])
 
         count = repo.delete_all_by_tool(tool.id)
 
@@ -133,13 +128,20 @@ class TestSnapshotRepository:
         """Test that old snapshots are deleted when exceeding MAX_SNAPSHOTS_PER_TOOL."""
         repo = SnapshotRepository(session)
 
-        # Create more than MAX_SNAPSHOTS_PER_TOOL snapshots
-        for i in range(MAX_SNAPSHOTS_PER_TOOL + 5):
-            repo.create_snapshot(
-                tool_id=tool.id,
-                html_content=f"<html>version {i}</html>",
-            )
+        # Insert more than MAX_SNAPSHOTS_PER_TOOL snapshots in one statement, bypassing retention
+        created_at = datetime.now(timezone.utc)
+        session.execute(
+            insert(ToolSnapshot),
+            [
+                {"tool_id": tool.id, "html_content": f"<html>version {i}</html>", "created_at": created_at}
+                for i in range(MAX_SNAPSHOTS_PER_TOOL + 5)
+            ],
+        )
+
+        deleted = repo.enforce_retention(tool.id)
+        session.commit()
 
+        assert deleted == 5
         snapshots = repo.get_snapshots_by_tool(tool.id)
 
         # Should only have MAX_SNAPSHOTS_PER_TOOL snapshots
@@ -147,10 +149,20 @@ class TestSnapshotRepository:
 
         # The oldest snapshots should be deleted (versions 0-4)
         # The newest should remain (versions 5-24)
-        contents = [s.html_content for s in snapshots]
-        assert "version 0" not in " ".join(contents)
-        assert "version 4" not in " ".join(contents)
-        assert f"version {MAX_SNAPSHOTS_PER_TOOL + 4}" in " ".join(contents)
+        assert snapshots[-1].html_content == "<html>version 5</html>"
+        assert snapshots[0].html_content == f"<html>version {MAX_SNAPSHOTS_PER_TOOL + 4}</html>"
+
+    def test_create_snapshot_makes_room_within_limit(self, session: Session, tool: Tool):
+        """Test that creating a snapshot at the limit deletes the oldest one."""
+        repo = SnapshotRepository(session)
+        repo.create_snapshots_bulk(tool.id, [f"<html>version {i}</html>" for i in range(MAX_SNAPSHOTS_PER_TOOL)])
+
+        repo.create_snapshot(tool_id=tool.id, html_content="<html>newest</html>")
+
+        snapshots = repo.get_snapshots_by_tool(tool.id)
+        assert len(snapshots) == MAX_SNAPSHOTS_PER_TOOL
+        assert snapshots[0].html_content == "<html>newest</html>"
+        assert snapshots[-1].html_content == "<html>version 1</html>"
 
     def test_count_snapshots(self, session: Session, tool: Tool):
         """Test counting snapshots."""
@@ -158,10 +170,30 @@ class TestSnapshotRepository:
 
         assert repo.count_snapshots(tool.id) == 0
 
-        for i in range(3):
-            repo.create_snapshot(
-                tool_id=tool.id,
-                html_content=f"<html>version {i}</html>",
-            )
+        repo.create_snapshots_bulk(tool.id, [f"<html>version {i}</html>" for i in range(3)])
 
         assert repo.count_snapshots(tool.id) == 3
+
+    def test_create_snapshots_bulk(self, session: Session, tool: Tool):
+        """Test that bulk creation keeps only the newest MAX_SNAPSHOTS_PER_TOOL contents."""
+        repo = SnapshotRepository(session)
+        repo.create_snapshot(tool_id=tool.id, html_content="<html>existing</html>")
+
+        created = repo.create_snapshots_bulk(
+            tool.id, [f"<html>version {i}</html>" for i in range(MAX_SNAPSHOTS_PER_TOOL + 5)]
+        )
+
+        assert len(created) == MAX_SNAPSHOTS_PER_TOOL
+        snapshots = repo.get_snapshots_by_tool(tool.id)
+        assert [s.id for s in snapshots] == [s.id for s in reversed(created)]
+        assert snapshots[0].html_content == f"<html>version {MAX_SNAPSHOTS_PER_TOOL + 4}</html>"
+        assert snapshots[-1].html_content == "<html>version 5</html>"
+
+    def test_create_snapshots_bulk_rejects_oversized_content(self, session: Session, tool: Tool):
+        """Test that bulk creation validates every content before inserting."""
+        repo = SnapshotRepository(session)
+
+        with pytest.raises(ValueError):
+            repo.create_snapshots_bulk(tool.id, ["<html>ok</html>", "x" * (MAX_CONTENT_SIZE_BYTES + 1)])
+
+        assert repo.count_snapshots(tool.id) == 0
@@ -1,5 +1,7 @@
 """Tests for template library API endpoints."""
 
+from typing import Any
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -9,28 +11,31 @@ from html_tool_manager.api.templates import (
 )
 from html_tool_manager.models.tool import NAME_MAX_LENGTH
 
+# テンプレートの追加はツールファイルを作成するため、一時ディレクトリに書き込む
+pytestmark = pytest.mark.usefixtures("test_tools_dir")
+
+
+@pytest.fixture(scope="module")
+def templates_data(shared_client: TestClient) -> dict[str, Any]:
+    """Fetch the template list once for all listing checks."""
+    response = shared_client.get("/api/templates/")
+    assert response.status_code == 200
+    return response.json()
+
 
 class TestListTemplates:
     """Tests for GET /api/templates/ endpoint."""
 
-    def test_list_templates_returns_templates_and_categories(self, client: TestClient):
+    def test_list_templates_returns_templates_and_categories(self, templates_data: dict[str, Any]):
         """Test that list templates returns both templates and categories."""
-        response = client.get("/api/templates/")
-        assert response.status_code == 200
-
-        data = response.json()
-        assert "templates" in data
-        assert "categories" in data
-        assert len(data["templates"]) > 0
-        assert len(data["categories"]) > 0
+        assert "templates" in templates_data
+        assert "categories" in templates_data
+        assert len(templates_data["templates"]) > 0
+        assert len(templates_data["categories"]) > 0
 
-    def test_list_templates_template_structure(self, client: TestClient):
+    def test_list_templates_template_structure(self, templates_data: dict[str, Any]):
         """Test that each template has required fields."""
-        response = client.get("/api/templates/")
-        assert response.status_code == 200
-
-        templates = response.json()["templates"]
-        for template in templates:
+        for template in templates_data["templates"]:
             assert "id" in template
             assert "name" in template
             assert "description" in template
@@ -39,22 +44,15 @@ class TestListTemplates:
             assert "tool_type" in template
             assert isinstance(template["tags"], list)
 
-    def test_list_templates_category_structure(self, client: TestClient):
+    def test_list_templates_category_structure(self, templates_data: dict[str, Any]):
         """Test that each category has required fields."""
-        response = client.get("/api/templates/")
-        assert response.status_code == 200
-
-        categories = response.json()["categories"]
-        for category in categories.values():
+        for category in templates_data["categories"].values():
             assert "name" in category
             assert "description" in category
 
-    def test_list_templates_has_expected_categories(self, client: TestClient):
+    def test_list_templates_has_expected_categories(self, templates_data: dict[str, Any]):
         """Test that expected categories exist."""
-        response = client.get("/api/templates/")
-        assert response.status_code == 200
-
-        categories = response.json()["categories"]
+        categories = templates_data["categories"]
         expected_categories = ["transform", "generate", "text", "dev"]
         for cat in expected_categories:
             assert cat in categories
@@ -63,16 +61,38 @@ class TestListTemplates:
 class TestAddTemplate:
     """Tests for POST /api/templates/{template_id}/add endpoint."""
 
-    def test_add_template_creates_tool(self, client: TestClient):
-        """Test that adding a template creates a new tool."""
-        response = client.post("/api/templates/json-formatter/add", json={})
+    @pytest.mark.parametrize(
+        ("template_id", "expected_name", "expected_tags", "description_part"),
+        [
+            ("json-formatter", "JSON整形ツール", ["JSON"], "JSON"),
+            ("uuid-generator", "UUID生成", ["UUID", "ID"], "UUID"),
+            ("char-counter", "文字数カウンター", ["文字数"], "文字数"),
+            ("color-picker", "カラーピッカー", ["色"], "HEX"),
+        ],
+    )
+    def test_add_template_creates_tool(
+        self,
+        client: TestClient,
+        template_id: str,
+        expected_name: str,
+        expected_tags: list[str],
+        description_part: str,
+    ):
+        """Test that adding a template creates a retrievable tool with the template's metadata."""
+        response = client.post(f"/api/templates/{template_id}/add", json={})
         assert response.status_code == 201
 
         data = response.json()
-        assert "id" in data
-        assert data["name"] == "JSON整形ツール"
-        assert "filepath" in data
+        assert data["name"] == expected_name
         assert data["tool_type"] == "html"
+        assert "filepath" in data
+        assert set(expected_tags) <= set(data["tags"])
+        assert description_part in data["description"]
+
+        # Retrieve the tool
+        get_response = client.get(f"/api/tools/{data['id']}")
+        assert get_response.status_code == 200
+        assert get_response.json()["name"] == expected_name
 
     def test_add_template_with_custom_name(self, client: TestClient):
         """Test that adding a template with custom name works."""
@@ -91,35 +111,6 @@ class TestAddTemplate:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_add_template_preserves_tags(self, client: TestClient):
-        """Test that tags are preserved when adding a template."""
-        response = client.post("/api/templates/uuid-generator/add", json={})
-        assert response.status_code == 201
-
-        data = response.json()
-        assert "UUID" in data["tags"]
-        assert "ID" in data["tags"]
-
-    def test_add_template_preserves_description(self, client: TestClient):
-        """Test that description is preserved when adding a template."""
-        response = client.post("/api/templates/char-counter/add", json={})
-        assert response.status_code == 201
-
-        data = response.json()
-        assert "文字数" in data["description"]
-
-    def test_added_tool_is_retrievable(self, client: TestClient):
-        """Test that a tool added from template can be retrieved."""
-        # Add template
-        add_response = client.post("/api/templates/color-picker/add", json={})
-        assert add_response.status_code == 201
-        tool_id = add_response.json()["id"]
-
-        # Retrieve the tool
-        get_response = client.get(f"/api/tools/{tool_id}")
-        assert get_response.status_code == 200
-        assert get_response.json()["name"] == "カラーピッカー"
-
 
 class TestTemplatesPage:
     """Tests for /templates page endpoint."""
@@ -1,8 +1,11 @@
 """バリデーションのテスト。"""
 
+import pytest
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
 from sqlmodel import Session
 
+from html_tool_manager.models import ToolCreate
 from html_tool_manager.models.tool import (
     DESCRIPTION_MAX_LENGTH,
     NAME_MAX_LENGTH,
@@ -10,34 +13,39 @@ from html_tool_manager.models.tool import (
     TAGS_MAX_COUNT,
 )
 
+# 201 を返すテストはツールファイルを作成するため、一時ディレクトリに書き込む
+pytestmark = pytest.mark.usefixtures("test_tools_dir")
+
+# 境界値テスト用の長い入力（モジュール読み込み時に1度だけ作る）
+_MAX_NAME = "a" * NAME_MAX_LENGTH
+_LONG_NAME = _MAX_NAME + "a"
+_LONG_DESCRIPTION = "a" * (DESCRIPTION_MAX_LENGTH + 1)
+_LONG_TAG = "a" * (TAG_MAX_LENGTH + 1)
+_MAX_QUERY = "a" * 500  # 検索クエリの max_length
+_LONG_QUERY = _MAX_QUERY + "a"
+_OVER_TAGS = [f"tag{i}" for i in range(TAGS_MAX_COUNT + 1)]
+_MAX_TAGS = _OVER_TAGS[:-1]
+
 
 class TestNameValidation:
     """名前フィールドのバリデーションテスト。"""
 
-    def test_empty_name_returns_422(self, session: Session, client: TestClient):
-        """空の名前で422が返ることをテストする。"""
+    @pytest.mark.parametrize(
+        "name",
+        ["", "   ", _LONG_NAME, "test\x00name"],
+        ids=["empty", "whitespace_only", "too_long", "control_chars"],
+    )
+    def test_invalid_name_rejected(self, name: str):
+        """不正な名前（空・空白のみ・長すぎる・制御文字を含む）が拒否されることをテストする。"""
+        with pytest.raises(ValidationError):
+            ToolCreate.model_validate({"name": name, "description": "Desc", "html_content": "<p>test</p>"})
+
+    def test_invalid_name_returns_422(self, session: Session, client: TestClient):
+        """バリデーションエラーがAPIでは422になることをテストする。"""
         tool_data = {"name": "", "description": "Desc", "html_content": "<p>test</p>"}
         response = client.post("/api/tools/", json=tool_data)
         assert response.status_code == 422
 
-    def test_whitespace_only_name_returns_422(self, session: Session, client: TestClient):
-        """空白のみの名前で422が返ることをテストする。"""
-        tool_data = {"name": "   ", "description": "Desc", "html_content": "<p>test</p>"}
-        response = client.post("/api/tools/", json=tool_data)
-        assert response.status_code == 422
-
-    def test_name_too_long_returns_422(self, session: Session, client: TestClient):
-        """長すぎる名前で422が返ることをテストする。"""
-        tool_data = {"name": "a" * (NAME_MAX_LENGTH + 1), "description": "Desc", "html_content": "<p>test</p>"}
-        response = client.post("/api/tools/", json=tool_data)
-        assert response.status_code == 422
-
-    def test_name_with_control_chars_returns_422(self, session: Session, client: TestClient):
-        """制御文字を含む名前で422が返ることをテストする。"""
-        tool_data = {"name": "test\x00name", "description": "Desc", "html_content": "<p>test</p>"}
-        response = client.post("/api/tools/", json=tool_data)
-        assert response.status_code == 422
-
     def test_name_trimmed(self, session: Session, client: TestClient):
         """名前の前後の空白がトリムされることをテストする。"""
         tool_data = {"name": "  trimmed name  ", "description": "Desc", "html_content": "<p>test</p>"}
@@ -47,7 +55,7 @@ class TestNameValidation:
 
     def test_valid_name_at_max_length(self, session: Session, client: TestClient):
         """最大長の名前が受け入れられることをテストする。"""
-        tool_data = {"name": "a" * NAME_MAX_LENGTH, "description": "Desc", "html_content": "<p>test</p>"}
+        tool_data = {"name": _MAX_NAME, "description": "Desc", "html_content": "<p>test</p>"}
         response = client.post("/api/tools/", json=tool_data)
         assert response.status_code == 201
 
@@ -55,17 +63,15 @@ class TestNameValidation:
 class TestDescriptionValidation:
     """説明フィールドのバリデーションテスト。"""
 
-    def test_description_too_long_returns_422(self, session: Session, client: TestClient):
-        """長すぎる説明で422が返ることをテストする。"""
-        tool_data = {"name": "Test", "description": "a" * (DESCRIPTION_MAX_LENGTH + 1), "html_content": "<p>test</p>"}
-        response = client.post("/api/tools/", json=tool_data)
-        assert response.status_code == 422
-
-    def test_description_with_control_chars_returns_422(self, session: Session, client: TestClient):
-        """制御文字を含む説明で422が返ることをテストする。"""
-        tool_data = {"name": "Test", "description": "desc\x00ription", "html_content": "<p>test</p>"}
-        response = client.post("/api/tools/", json=tool_data)
-        assert response.status_code == 422
+    @pytest.mark.parametrize(
+        "description",
+        [_LONG_DESCRIPTION, "desc\x00ription"],
+        ids=["too_long", "control_chars"],
+    )
+    def test_invalid_description_rejected(self, description: str):
+        """不正な説明（長すぎる・制御文字を含む）が拒否されることをテストする。"""
+        with pytest.raises(ValidationError):
+            ToolCreate.model_validate({"name": "Test", "description": description, "html_content": "<p>test</p>"})
 
     def test_description_with_newline_allowed(self, session: Session, client: TestClient):
         """改行を含む説明が許可されることをテストする。"""
@@ -86,44 +92,30 @@ class TestQueryValidation:
     def test_query_too_long_returns_422(self, session: Session, client: TestClient):
         """長すぎる検索クエリで422が返ることをテストする。"""
         # max_length=500を超えるクエリ
-        long_query = "a" * 501
-        response = client.get(f"/api/tools/?q={long_query}")
+        response = client.get("/api/tools/", params={"q": _LONG_QUERY})
         assert response.status_code == 422
 
     def test_query_at_max_length_accepted(self, session: Session, client: TestClient):
         """最大長の検索クエリが受け入れられることをテストする。"""
         # max_length=500のクエリ
-        max_query = "a" * 500
-        response = client.get(f"/api/tools/?q={max_query}")
+        response = client.get("/api/tools/", params={"q": _MAX_QUERY})
         assert response.status_code == 200
 
 
 class TestTagsValidation:
     """タグフィールドのバリデーションテスト。"""
 
-    def test_too_many_tags_returns_422(self, session: Session, client: TestClient):
-        """タグが多すぎると422が返ることをテストする。"""
-        tags = [f"tag{i}" for i in range(TAGS_MAX_COUNT + 1)]
-        tool_data = {"name": "Test", "description": "Desc", "html_content": "<p>test</p>", "tags": tags}
-        response = client.post("/api/tools/", json=tool_data)
-        assert response.status_code == 422
-
-    def test_tag_too_long_returns_422(self, session: Session, client: TestClient):
-        """長すぎるタグで422が返ることをテストする。"""
-        tool_data = {
-            "name": "Test",
-            "description": "Desc",
-            "html_content": "<p>test</p>",
-            "tags": ["a" * (TAG_MAX_LENGTH + 1)],
-        }
-        response = client.post("/api/tools/", json=tool_data)
-        assert response.status_code == 422
-
-    def test_tag_with_control_chars_returns_422(self, session: Session, client: TestClient):
-        """制御文字を含むタグで422が返ることをテストする。"""
-        tool_data = {"name": "Test", "description": "Desc", "html_content": "<p>test</p>", "tags": ["tag\x00name"]}
-        response = client.post("/api/tools/", json=tool_data)
-        assert response.status_code == 422
+    @pytest.mark.parametrize(
+        "tags",
+        [_OVER_TAGS, [_LONG_TAG], ["tag\x00name"]],
+        ids=["too_many", "too_long", "control_chars"],
+    )
+    def test_invalid_tags_rejected(self, tags: list[str]):
+        """不正なタグ（多すぎる・長すぎる・制御文字を含む）が拒否されることをテストする。"""
+        with pytest.raises(ValidationError):
+            ToolCreate.model_validate(
+                {"name": "Test", "description": "Desc", "html_content": "<p>test</p>", "tags": tags}
+            )
 
     def test_empty_tags_skipped(self, session: Session, client: TestClient):
         """空のタグがスキップされることをテストする。"""
@@ -141,8 +133,7 @@ class TestTagsValidation:
 
     def test_max_tags_allowed(self, session: Session, client: TestClient):
         """最大数のタグが許可されることをテストする。"""
-        tags = [f"tag{i}" for i in range(TAGS_MAX_COUNT)]
-        tool_data = {"name": "Test", "description": "Desc", "html_content": "<p>test</p>", "tags": tags}
+        tool_data = {"name": "Test", "description": "Desc", "html_content": "<p>test</p>", "tags": _MAX_TAGS}
         response = client.post("/api/tools/", json=tool_data)
         assert response.status_code == 201
         assert len(response.json()["tags"]) == TAGS_MAX_COUNT